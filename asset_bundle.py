@@ -0,0 +1,173 @@
+"""
+Baked asset bundle: decoded, scaled, display-format pixels for every image
+the game asked the asset registry for, in one memory-mapped file. Surfaces
+are created straight on top of the mapping, so a warm start skips PNG
+decoding and scaling entirely.
+
+Each entry records its source file's size, mtime and SHA-1; an entry whose
+source changed is ignored (and re-baked on the next save), as is the whole
+bundle if the display pixel format differs.
+
+save() replaces the bundle in place when it can. Where a mapped file can't
+be replaced (Windows), the new bundle is left next to it as "<path>.new"
+and swapped in by the next start, before anything is mapped.
+
+File layout
+───────────
+    b"HAB1" | uint32 manifest length | manifest (JSON, UTF-8) | pixel blocks (64-byte aligned)
+
+Public API
+──────────
+    bundle = AssetBundle("assets.bundle")
+    surf = bundle.get(path, scale, smooth)       # Surface | None (missing / stale)
+    bundle.add(path, scale, smooth, surf)        # decoded elsewhere – bake it next save()
+    bundle.save()                                # rewrite if anything was added
+"""
+
+from __future__ import annotations
+import hashlib, json, mmap, os, struct
+import pygame
+
+MAGIC = b"HAB1"
+VERSION = 1
+ALIGN = 64
+_HEAD = struct.Struct("<4sI")
+_FORMATS = {                    # convert_alpha() masks → frombuffer/tobytes format
+    (0xFF0000, 0xFF00, 0xFF, 0xFF000000): "BGRA",
+    (0xFF, 0xFF00, 0xFF0000, 0xFF000000): "RGBA",
+    (0xFF00, 0xFF0000, 0xFF000000, 0xFF): "ARGB",
+}
+
+
+def _key(path, scale, smooth) -> str:
+    size = f"{scale[0]}x{scale[1]}" if scale else "orig"
+    return f"{path}|{size}|{int(bool(smooth))}"
+
+
+def _sha1(path) -> str:
+    with open(path, "rb") as f:
+        return hashlib.file_digest(f, "sha1").hexdigest()
+
+
+def display_format() -> str | None:
+    """Byte order of convert_alpha() surfaces on this display (None if unsupported)."""
+    return _FORMATS.get(tuple(pygame.Surface((1, 1), pygame.SRCALPHA).convert_alpha().get_masks()))
+
+
+class AssetBundle:
+    def __init__(self, path):
+        self.path = str(path)
+        self.entries: dict[str, dict] = {}       # key → manifest entry
+        self.format: str | None = None
+        self._mm: mmap.mmap | None = None
+        self._new: dict[str, tuple[dict, pygame.Surface]] = {}
+        self._checked: set[str] = set()          # sources verified this run
+        self._opened = False
+        self.hits = self.misses = 0
+
+    @property
+    def dirty(self) -> bool:
+        return bool(self._new)
+
+    # ---------------------------------------------------------
+    def _open(self):
+        """Map the bundle (lazily – needs the display mode for the pixel format)."""
+        self._opened = True
+        self.format = display_format()
+        if os.path.exists(self.path + ".new"):          # saved while the old one was mapped
+            try:
+                os.replace(self.path + ".new", self.path)
+            except OSError as e:
+                print(f"Asset bundle update not installed ({e})")
+        try:
+            f = open(self.path, "rb")
+        except FileNotFoundError:
+            return
+        with f:
+            magic, n = _HEAD.unpack(f.read(_HEAD.size))
+            manifest = json.loads(f.read(n))
+            if magic != MAGIC or manifest.get("version") != VERSION or manifest.get("format") != self.format:
+                print(f"Asset bundle {self.path} is for another version / pixel format – rebuilding")
+                return
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)   # private pages: surfaces may write
+        self.entries = manifest["entries"]
+
+    def _fresh(self, entry: dict) -> bool:
+        src = entry["src"]
+        if src in self._checked:
+            return True
+        try:
+            st = os.stat(src)
+        except OSError:
+            return False
+        if (st.st_size, st.st_mtime_ns) != (entry["src_size"], entry["src_mtime_ns"]):
+            if st.st_size != entry["src_size"] or _sha1(src) != entry["sha1"]:
+                return False
+            entry["src_mtime_ns"] = st.st_mtime_ns          # touched but identical
+        self._checked.add(src)
+        return True
+
+    def get(self, path, scale=None, smooth: bool = False) -> pygame.Surface | None:
+        if not self._opened:
+            self._open()
+        entry = self.entries.get(_key(path, scale, smooth))
+        if entry is None or self._mm is None or not self._fresh(entry):
+            self.misses += 1
+            return None
+        self.hits += 1
+        w, h = entry["size"]
+        buf = memoryview(self._mm)[entry["offset"]:entry["offset"] + w * h * 4]
+        return pygame.image.frombuffer(buf, (w, h), self.format)
+
+    def add(self, path, scale, smooth: bool, surface: pygame.Surface):
+        if not self._opened:
+            self._open()
+        if self.format is None:
+            return                                   # unusual display format: no baking
+        st = os.stat(path)
+        entry = {"src": str(path), "src_size": st.st_size, "src_mtime_ns": st.st_mtime_ns,
+                 "sha1": _sha1(path), "size": list(surface.get_size())}
+        self._new[_key(path, scale, smooth)] = (entry, surface)
+
+    # ---------------------------------------------------------
+    def save(self):
+        """Write fresh old entries + everything added since opening."""
+        if not self._new or self.format is None:
+            return
+        blocks: list[tuple[str, dict, bytes]] = []
+        for key, entry in self.entries.items():
+            if key not in self._new and self._mm is not None and self._fresh(entry):
+                w, h = entry["size"]
+                blocks.append((key, dict(entry), self._mm[entry["offset"]:entry["offset"] + w * h * 4]))
+        for key, (entry, surf) in self._new.items():
+            blocks.append((key, entry, pygame.image.tobytes(surf, self.format)))
+
+        # offsets depend on the manifest length, which depends on the offsets: iterate to a fixpoint
+        manifest = {"version": VERSION, "format": self.format, "entries": {}}
+        start = 0
+        while True:
+            pos = start
+            for key, entry, data in blocks:
+                entry["offset"] = pos
+                manifest["entries"][key] = entry
+                pos += -(-len(data) // ALIGN) * ALIGN
+            raw = json.dumps(manifest).encode()
+            head = -(-(_HEAD.size + len(raw)) // ALIGN) * ALIGN
+            if head == start:
+                break
+            start = head
+
+        tmp = self.path + ".tmp"
+        with open(tmp, "wb") as f:
+            f.write(_HEAD.pack(MAGIC, len(raw)) + raw)
+            for _, entry, data in blocks:
+                f.seek(entry["offset"])
+                f.write(data)
+        target = self.path
+        try:
+            os.replace(tmp, target)
+        except OSError:                              # e.g. Windows: the old bundle is still mapped
+            target = self.path + ".new"
+            os.replace(tmp, target)
+        print(f"Asset bundle: baked {len(self._new)} new image(s), {len(blocks)} total → {target}")
+        self._new.clear()
@@ -0,0 +1,101 @@
+"""
+Asset registry: every image file / folder is decoded once, and scaled
+variants are cached (bounded LRU) so spawning never touches the disk.
+
+Public API
+──────────
+    from asset_registry import registry
+    imgs = registry.folder("assets/asteroid")              # list[Surface], loaded once
+    img  = registry.image("assets/logo.png", scale=(64, 64))
+    rock = registry.scale_random(random.choice(imgs))      # size snapped to SIZE_BUCKET
+
+    registry.use_bundle("assets.bundle")   # serve images from a baked asset_bundle.AssetBundle
+    registry.save_bundle()                 # bake whatever had to be decoded this run
+"""
+
+from __future__ import annotations
+import os, random
+from collections import OrderedDict
+from pathlib import Path
+import pygame
+
+from asset_bundle import AssetBundle
+
+SIZE_BUCKET = 5          # px – random sizes are snapped to multiples of this
+MAX_SCALED = 128         # scaled variants kept before LRU eviction
+SUPPORTED = ('.png', '.jpg', '.jpeg')
+
+
+class AssetRegistry:
+    def __init__(self, max_scaled: int = MAX_SCALED):
+        self.max_scaled = max_scaled
+        self._folders: dict[tuple, list[pygame.Surface]] = {}
+        self._images: dict[tuple, pygame.Surface] = {}
+        self._scaled: OrderedDict[tuple[pygame.Surface, tuple[int, int]], pygame.Surface] = OrderedDict()
+        self.bundle: AssetBundle | None = None
+
+    def use_bundle(self, path):
+        self.bundle = AssetBundle(path)
+
+    def save_bundle(self):
+        if self.bundle is not None:
+            self.bundle.save()
+
+    # ---------------------------------------------------------
+    # loading (needs a display mode set, because of convert_alpha)
+    def folder(self, path, scale: tuple[int, int] | None = None) -> list[pygame.Surface]:
+        """All images in *path*, decoded on first request only."""
+        key = (str(Path(path)), scale)
+        if key not in self._folders:
+            files = [os.path.join(key[0], f) for f in sorted(os.listdir(key[0]))    # stable order
+                     if f.lower().endswith(SUPPORTED)]
+            if not files:
+                raise FileNotFoundError(f'No images found in “{key[0]}”.')
+            self._folders[key] = [self.image(f, scale) for f in files]
+        return self._folders[key]
+
+    def image(self, path, scale: tuple[int, int] | None = None, smooth: bool = False) -> pygame.Surface:
+        """Single image, decoded (and scaled) on first request only."""
+        key = (str(Path(path)), scale, smooth)
+        if key not in self._images:
+            img = self.bundle.get(*key) if self.bundle is not None else None
+            if img is None:
+                img = pygame.image.load(key[0]).convert_alpha()
+                if scale:
+                    img = (pygame.transform.smoothscale if smooth else pygame.transform.scale)(img, scale)
+                if self.bundle is not None:
+                    self.bundle.add(*key, img)
+            self._images[key] = img
+        return self._images[key]
+
+    # ---------------------------------------------------------
+    # scaled variants
+    def scaled(self, img: pygame.Surface, size: tuple[int, int]) -> pygame.Surface:
+        key = (img, size)
+        out = self._scaled.get(key)
+        if out is None:
+            out = self._scaled[key] = pygame.transform.scale(img, size)
+            if len(self._scaled) > self.max_scaled:
+                self._scaled.popitem(last=False)
+        else:
+            self._scaled.move_to_end(key)
+        return out
+
+    def scale_random(self, img: pygame.Surface,
+                     min_size: int = 40, max_size: int = 100) -> pygame.Surface:
+        """Like helpers.scale_random, but sizes come from a small cached set."""
+        size = self.snap_size(random.randint(min_size, max_size), min_size, max_size)
+        return self.scaled(img, (size, size))
+
+    @staticmethod
+    def snap_size(size: int, min_size: int = 40, max_size: int = 100) -> int:
+        """*size* snapped to a multiple of SIZE_BUCKET inside [min_size, max_size]."""
+        return max(min_size, min(max_size, round(size / SIZE_BUCKET) * SIZE_BUCKET))
+
+    def clear(self):
+        self._folders.clear()
+        self._images.clear()
+        self._scaled.clear()
+
+
+registry = AssetRegistry()
@@ -0,0 +1,192 @@
+"""
+Asteroid field: every asteroid is a slot in a set of NumPy arrays
+(struct-of-arrays) instead of a Sprite object, so motion, spin and
+off-screen culling run as one vectorised step for the whole field.
+
+Each distinct source image is a "kind"; its rotated frames (and their
+masks) come from the shared rotation cache, so they share its byte-capped LRU.
+
+Public API
+──────────
+    from asteroid_field import AsteroidField
+    field = AsteroidField(screen_w, screen_h)
+    pos, vel, spin = field.edge_spawns(n, rng)  # n entries from random edges (np.random.Generator)
+    i = field.spawn(img, pos[k], vel[k], spin[k])
+    field.update()                              # move, spin, cull – once per simulation tick
+    field.draw(screen, alpha)                   # → [Rect, …]; alpha interpolates from the previous tick
+    len(field)                                  # asteroids alive
+    field.hits / field.misses                   # spawns into a free slot / that had to grow the arrays
+    field.rects()                               # (indices, float32[n, 4] x0, y0, x1, y1)
+    field.rect(i) / field.frame(i) / field.mask(i)
+    field.kill(indices)
+"""
+
+from __future__ import annotations
+import numpy as np
+import pygame
+
+from rotation_cache import rotations
+
+CAPACITY = 256            # initial slots (doubles when full)
+CULL_MARGIN = 50          # px beyond the screen edge before an asteroid is dropped
+SPAWN_OFFSET = 40         # px outside the screen where asteroids appear
+MIN_SPEED, MAX_SPEED = 2, 4       # px / tick
+MAX_SPIN = 2.0                    # degrees / tick
+
+
+class AsteroidField:
+    name = "asteroid"
+
+    def __init__(self, screen_w: int, screen_h: int, capacity: int = CAPACITY):
+        self.W, self.H = screen_w, screen_h
+        self.step = rotations.step
+        self.n_buckets = round(360 / self.step)
+
+        self.pos = np.zeros((capacity, 2), np.float32)     # centre, px
+        self.prev_pos = np.zeros((capacity, 2), np.float32)  # centre before the last update()
+        self.vel = np.zeros((capacity, 2), np.float32)     # px / tick
+        self.angle = np.zeros(capacity, np.float32)        # degrees
+        self.spin = np.zeros(capacity, np.float32)         # degrees / tick
+        self.size = np.zeros((capacity, 2), np.float32)    # unrotated w, h
+        self.kind = np.zeros(capacity, np.int32)
+        self.alive = np.zeros(capacity, bool)
+        self.count = 0                                     # slots ever used (high-water mark)
+        self._free: list[int] = []
+        self.hits = self.misses = 0
+
+        self.kinds: list[pygame.Surface] = []
+        self._kind_of: dict[pygame.Surface, int] = {}
+
+    def __len__(self):
+        return int(self.alive[:self.count].sum())
+
+    # ---------------------------------------------------------
+    # spawning / removal
+    def spawn(self, img: pygame.Surface, pos, velocity, spin: float = 0.0, angle: float = 0.0) -> int:
+        if self._free:
+            i = self._free.pop()
+            self.hits += 1
+        else:
+            i = self._next_slot()
+        self.pos[i] = self.prev_pos[i] = pos
+        self.vel[i] = velocity
+        self.angle[i] = angle
+        self.spin[i] = spin
+        self.size[i] = img.get_size()
+        self.kind[i] = self._kind(img)
+        self.alive[i] = True
+        return i
+
+    def edge_spawns(self, n: int, rng: np.random.Generator):
+        """
+        *n* entry points on random screen edges, each drifting toward a point
+        near the centre → (pos float32[n, 2], vel float32[n, 2], spin float32[n]).
+        """
+        w, h = self.W, self.H
+        side = rng.integers(0, 4, n)                               # top, bottom, left, right
+        pos = np.stack([rng.integers(0, w + 1, n), rng.integers(0, h + 1, n)], axis=1).astype(np.float32)
+        pos[side == 0, 1] = -SPAWN_OFFSET
+        pos[side == 1, 1] = h + SPAWN_OFFSET
+        pos[side == 2, 0] = -SPAWN_OFFSET
+        pos[side == 3, 0] = w + SPAWN_OFFSET
+
+        target = np.array([w // 2, h // 2], np.float32) + rng.integers(-100, 101, (n, 2))
+        d = target - pos
+        speed = rng.uniform(MIN_SPEED, MAX_SPEED, n) / np.maximum(np.hypot(d[:, 0], d[:, 1]), 1e-6)
+        vel = (d * speed[:, None]).astype(np.float32)
+        spin = rng.uniform(-MAX_SPIN, MAX_SPIN, n).astype(np.float32)
+        return pos, vel, spin
+
+    def kill(self, indices):
+        indices = np.unique(np.asarray(indices, dtype=np.intp))
+        indices = indices[self.alive[indices]]
+        self.alive[indices] = False
+        self._free.extend(indices.tolist())
+
+    def clear(self):
+        self.alive[:] = False
+        self.count = 0
+        self._free.clear()
+
+    def reset_stats(self):
+        self.hits = self.misses = 0
+
+    def __str__(self):
+        n = self.hits + self.misses
+        return f"{self.name} {self.hits / n if n else 1:.0%} hit ({self.misses} grow, {len(self)} live)"
+
+    # ---------------------------------------------------------
+    # per frame
+    def update(self):
+        n = self.count
+        alive = self.alive[:n]
+        self.prev_pos[:n] = self.pos[:n]
+        self.pos[:n][alive] += self.vel[:n][alive]
+        self.angle[:n] = (self.angle[:n] + self.spin[:n]) % 360
+
+        idx, r = self.rects()
+        m = CULL_MARGIN
+        gone = (r[:, 2] < -m) | (r[:, 0] > self.W + m) | (r[:, 3] < -m) | (r[:, 1] > self.H + m)
+        if gone.any():
+            self.kill(idx[gone])
+
+    def draw(self, surface: pygame.Surface, alpha: float = 1.0) -> list[pygame.Rect]:
+        idx, r = self.rects()
+        w, h = surface.get_size()
+        on_screen = (r[:, 2] > 0) & (r[:, 0] < w) & (r[:, 3] > 0) & (r[:, 1] < h)
+        idx = idx[on_screen]
+        buckets = self._buckets(idx).tolist()
+        kinds = self.kind[idx].tolist()
+        p0 = self.prev_pos[idx]
+        centres = (p0 + (self.pos[idx] - p0) * alpha).tolist()
+        blits, frames, step = [], self.kinds, self.step
+        for k, b, (x, y) in zip(kinds, buckets, centres):
+            f = rotations.get(frames[k], b * step)
+            blits.append((f, (x - f.get_width() * 0.5, y - f.get_height() * 0.5)))
+        return surface.blits(blits)
+
+    # ---------------------------------------------------------
+    # geometry (used by collision.py)
+    def rects(self) -> tuple[np.ndarray, np.ndarray]:
+        """Alive slot indices and their rotated bounding boxes as float32[n, 4] (x0, y0, x1, y1)."""
+        idx = np.flatnonzero(self.alive[:self.count])
+        theta = np.radians(self._buckets(idx) * self.step)
+        c, s = np.abs(np.cos(theta)), np.abs(np.sin(theta))
+        w, h = self.size[idx, 0], self.size[idx, 1]
+        half = np.stack([w * c + h * s, w * s + h * c], axis=1) * 0.5
+        centre = self.pos[idx]
+        return idx, np.concatenate([centre - half, centre + half], axis=1)
+
+    def frame(self, i: int) -> pygame.Surface:
+        return rotations.get(self.kinds[int(self.kind[i])], int(self._buckets(i)) * self.step)
+
+    def rect(self, i: int) -> pygame.Rect:
+        x, y = self.pos[i]
+        return self.frame(i).get_rect(center=(round(float(x)), round(float(y))))
+
+    def mask(self, i: int) -> pygame.mask.Mask:
+        """Collision mask of slot *i*'s current frame, built on first request."""
+        return rotations.mask(self.frame(i))
+
+    # ---------------------------------------------------------
+    def _buckets(self, idx):
+        return np.round(self.angle[idx] / self.step).astype(np.int32) % self.n_buckets
+
+    def _kind(self, img: pygame.Surface) -> int:
+        k = self._kind_of.get(img)
+        if k is None:
+            k = self._kind_of[img] = len(self.kinds)
+            self.kinds.append(img)
+        return k
+
+    def _next_slot(self) -> int:
+        if self.count < len(self.alive):
+            self.hits += 1
+        else:
+            self.misses += 1
+            grow = len(self.alive)
+            for name in ("pos", "prev_pos", "vel", "angle", "spin", "size", "kind", "alive"):
+                a = getattr(self, name)
+                setattr(self, name, np.concatenate([a, np.zeros((grow,) + a.shape[1:], a.dtype)]))
+        self.count += 1
+        return self.count - 1
@@ -0,0 +1,178 @@
+"""
+Headless frame-time benchmark.
+Runs the real game loop under SDL's dummy video driver with a scripted
+hand input (no webcam, no window) starting at a fixed wave, then reports
+frame-time percentiles and per-stage timings. `--seed` fixes both the
+scripted hands and the asteroid waves, so runs are comparable commit to commit.
+
+    python bench.py --frames 1800 --wave 3 --out bench_results.json
+    python bench.py --landmarks session.hlm          # replay a recorded session instead
+    python bench.py --no-webcam --dirty              # dirty-rect rendering path
+"""
+
+from __future__ import annotations
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")      # before pygame opens a display
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import argparse, gc, json, math, platform, subprocess, time
+import numpy as np
+import pygame
+
+from game import Game, WIDTH, HEIGHT
+from capture import Frame
+from tracking import FULL_VIEW
+from hand_state import HandState
+from profiling import StageTimer
+from collision import mask_stats
+from input_sources import LandmarkStreamSource
+
+
+# ───────────────────────────────────────────────
+# Scripted input
+# ───────────────────────────────────────────────
+def _hand(cx: float, cy: float, is_open: bool) -> np.ndarray:
+    """Crude 21-point hand around (cx, cy): fingertips above (open) or below (fist) their PIP joints."""
+    arr = np.zeros((21, 3))
+    arr[:, 0], arr[:, 1] = cx, cy
+    tip_dy = -0.06 if is_open else 0.03
+    for tip, pip in ((8, 6), (12, 10), (16, 14), (20, 18)):
+        arr[pip, 1] = cy - 0.02
+        arr[tip, 1] = cy - 0.02 + tip_dy
+    return arr
+
+
+class ScriptedInput:
+    """
+    Fake camera + detector: a fixed background frame delivered at *cam_fps*,
+    a left hand tracing a Lissajous curve and a right hand opening every *shoot_period* s.
+    """
+    def __init__(self, cam_fps: float = 30, shoot_period: float = 0.6, seed: int = 0):
+        rng = np.random.default_rng(seed)
+        self.bgr = rng.integers(0, 255, (HEIGHT, WIDTH, 3), dtype=np.uint8)
+        self.rgb = self.bgr[::3, ::3, ::-1].copy()
+        self.cam_dt = 1 / cam_fps
+        self.shoot_period = shoot_period
+        self.t0 = time.perf_counter()
+        self._frame = None
+        self._seq = 0
+        self.hands_ts = 0.0
+
+    def latest_frame(self):
+        now = time.perf_counter()
+        if self._frame is None or now - self._frame.timestamp >= self.cam_dt:
+            self._seq += 1
+            self._frame = Frame(self.bgr, self.rgb, FULL_VIEW, now, self._seq)
+        return self._frame
+
+    def hands(self, frame):
+        self.hands_ts = time.perf_counter()
+        t = self.hands_ts - self.t0
+        left = _hand(0.5 + 0.35 * math.sin(t * 0.9), 0.6 + 0.25 * math.sin(t * 1.3), True)
+        firing = (t % self.shoot_period) < self.shoot_period / 2
+        right = _hand(0.5 + 0.3 * math.cos(t * 0.7), 0.2, firing)
+        return HandState(left), HandState(right)
+
+    def close(self):
+        pass
+
+
+# ───────────────────────────────────────────────
+# Stats
+# ───────────────────────────────────────────────
+def summarize(samples_ms) -> dict:
+    a = np.asarray(samples_ms, dtype=np.float64)
+    if a.size == 0:
+        return {"n": 0}
+    p50, p95, p99 = np.percentile(a, [50, 95, 99])
+    return {"n": int(a.size), "mean": float(a.mean()), "p50": float(p50),
+            "p95": float(p95), "p99": float(p99), "max": float(a.max())}
+
+
+def _git_commit() -> str | None:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+# ───────────────────────────────────────────────
+# Runner
+# ───────────────────────────────────────────────
+def run_bench(frames: int, wave: int, warmup: int, seed: int, fps: int, hand_input=None,
+              show_webcam: bool = True, dirty_rects: bool = False) -> dict:
+    pygame.init()
+    screen = pygame.display.set_mode((WIDTH, HEIGHT))
+    timer = StageTimer(capacity=frames)
+    hand_input = hand_input or ScriptedInput(seed=seed)
+    game = Game(screen, hand_input, timer=timer, show_webcam=show_webcam, dirty_rects=dirty_rects, seed=seed)
+    game.ship.health = 10**9                       # the benchmark must not end in GAME_OVER
+    game.wave_mgr.launch_if_menu(first_wave=wave)
+
+    clock = pygame.time.Clock()
+    max_asteroids = 0
+    masks_built = []
+    for i in range(warmup + frames):
+        if i == warmup:                            # drop warm-up samples (cache fills, first spawns)
+            timer.reset()
+            masks_built.clear()
+            game.renderer.full_frames = game.renderer.dirty_frames = 0
+            gc_before = [g["collections"] for g in gc.get_stats()]
+        timer.restart_frame()
+        game.step(game.clock.dt)                  # exactly one simulation tick per frame
+        timer.end_frame()
+        max_asteroids = max(max_asteroids, len(game.field))
+        masks_built.append(mask_stats.last_frame)
+        if fps:
+            clock.tick(fps)
+    gc_runs = [g["collections"] - b for g, b in zip(gc.get_stats(), gc_before)]
+    hand_input.close()
+    pygame.quit()
+
+    return {
+        "commit": _git_commit(),
+        "python": platform.python_version(),
+        "pygame": pygame.version.ver,
+        "config": {"frames": frames, "warmup": warmup, "wave": wave, "seed": seed, "fps_cap": fps,
+                   "webcam": show_webcam, "dirty_rects": dirty_rects},
+        "frame_ms": summarize(timer.frames),
+        "stages_ms": {name: summarize(s) for name, s in timer.samples.items()},
+        "max_asteroids": max_asteroids,
+        "masks_per_frame": summarize(masks_built),
+        "dirty_frames": game.renderer.dirty_frames,
+        "pools": {p.name: {"hits": p.hits, "misses": p.misses} for p in game.pools},   # incl. warm-up
+        "gc_collections": gc_runs,                         # per generation, measured frames only
+    }
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--frames", type=int, default=1800, help="measured frames")
+    ap.add_argument("--warmup", type=int, default=120, help="frames run before measuring")
+    ap.add_argument("--wave", type=int, default=3, help="wave to start at")
+    ap.add_argument("--seed", type=int, default=0)
+    ap.add_argument("--fps", type=int, default=0, help="frame cap like the game's clock.tick (0 = uncapped)")
+    ap.add_argument("--no-webcam", action="store_true", help="don't draw the webcam overlay")
+    ap.add_argument("--dirty", action="store_true", help="dirty-rect rendering (needs --no-webcam to kick in)")
+    ap.add_argument("--landmarks", help="recorded landmark stream to replay (default: scripted hands)")
+    ap.add_argument("--out", default="bench_results.json", help="JSON results file")
+    args = ap.parse_args()
+
+    hand_input = LandmarkStreamSource(args.landmarks) if args.landmarks else None
+    result = run_bench(args.frames, args.wave, args.warmup, args.seed, args.fps, hand_input,
+                       show_webcam=not args.no_webcam, dirty_rects=args.dirty)
+    result["config"]["input"] = args.landmarks or "scripted"
+    with open(args.out, "w") as f:
+        json.dump(result, f, indent=2)
+
+    fm = result["frame_ms"]
+    print(f"frame  p50 {fm['p50']:.2f}  p95 {fm['p95']:.2f}  p99 {fm['p99']:.2f} ms")
+    for name, s in result["stages_ms"].items():
+        print(f"  {name:<8} p50 {s['p50']:.2f}  p95 {s['p95']:.2f}  p99 {s['p99']:.2f} ms")
+    print("pools  " + "   ".join(f"{k} {v['hits']}/{v['hits'] + v['misses']} hit" for k, v in result["pools"].items()))
+    print(f"→ {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""
+Threaded webcam capture.
+A background thread reads + preprocesses frames so the render loop never
+blocks on the camera; it just asks for the newest frame.
+
+Public API
+──────────
+    capture = CameraCapture(cam, (w, h)).start()
+    frame = capture.latest()     # Frame | None, never blocks
+    capture.dropped              # frames replaced before anyone read them
+    capture.stop()
+"""
+
+from __future__ import annotations
+import threading, time
+from collections import deque
+
+from tracking import grab_frame
+
+
+class Frame:
+    """One preprocessed camera frame (+ when it was captured)."""
+    __slots__ = ("bgr", "rgb", "view", "timestamp", "seq", "blur_ms", "blur_detect_ms")
+
+    def __init__(self, bgr, rgb, view, timestamp: float, seq: int, blur_ms: float = 0.0,
+                 blur_detect_ms: float = 0.0):
+        self.bgr = bgr                  # display frame (screen size, blurred)
+        self.rgb = rgb                  # detection frame (small, sharp)
+        self.view = view                # tracking.to_screen crop of bgr inside rgb
+        self.timestamp = timestamp      # time.perf_counter() seconds when cam.read() returned
+        self.seq = seq                  # 1, 2, 3 … per capture session
+        self.blur_ms = blur_ms          # preprocessing time spent blurring bgr (capture thread)
+        self.blur_detect_ms = blur_detect_ms    # … and blurring rgb (BLUR_DETECTION only)
+
+    @property
+    def age(self) -> float:
+        """Seconds since this frame was read from the camera (preprocessing included)."""
+        return time.perf_counter() - self.timestamp
+
+
+class CameraCapture:
+    def __init__(self, cam, size: tuple[int, int], buffer_len: int = 3,
+                 blur: str = "pyramid", blur_detect: bool = False, detect_size: int = 256):
+        self.cam = cam
+        self.W, self.H = size
+        self.blur, self.blur_detect = blur, blur_detect      # see tracking.blur_frame
+        self.detect_size = detect_size                       # longest side of Frame.rgb
+        self._ring: deque[Frame] = deque(maxlen=buffer_len)   # old frames fall off
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+        self._running = False
+
+        self._seq = 0            # last frame produced
+        self._last_read = 0      # last frame handed out by latest()
+        self.dropped = 0
+
+    # ---------------------------------------------------------
+    # external API
+    def start(self) -> CameraCapture:
+        if self._thread is None:
+            self._running = True
+            self._thread = threading.Thread(target=self._run, name="camera-capture", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        self._running = False
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+            self._thread = None
+
+    def latest(self) -> Frame | None:
+        """Newest frame (may be the same one as last call – compare `.seq`)."""
+        with self._lock:
+            frame = self._ring[-1] if self._ring else None
+        if frame is not None and frame.seq > self._last_read:
+            if self._last_read:
+                self.dropped += frame.seq - self._last_read - 1
+            self._last_read = frame.seq
+        return frame
+
+    def recent(self) -> list[Frame]:
+        """Snapshot of the ring buffer, oldest first."""
+        with self._lock:
+            return list(self._ring)
+
+    # ---------------------------------------------------------
+    # capture thread
+    def _run(self):
+        stats = {}
+        while self._running:
+            frame_bgr, frame_rgb, view = grab_frame(self.cam, self.W, self.H, self.blur,
+                                                    self.blur_detect, self.detect_size, stats)
+            if frame_bgr is None:
+                time.sleep(0.01)          # camera hiccup – don't spin
+                continue
+            self._seq += 1
+            frame = Frame(frame_bgr, frame_rgb, view, stats["read_ts"], self._seq,
+                          stats.get("blur", 0.0), stats.get("blur_detect", 0.0))
+            with self._lock:
+                self._ring.append(frame)
@@ -0,0 +1,139 @@
+"""
+Collision detection with a uniform-grid broad phase.
+The asteroid field's slots (asteroid_field.AsteroidField) are hashed into
+square cells by their rotated bounding box; only sprites that share a cell
+with a slot *and* overlap its box reach the narrow phase (pixel masks, or
+circles for cheap asteroid-vs-bullet checks). Cost follows the number of
+near-contacts instead of len(field) × len(group).
+
+    grid = SpatialGrid(cell=64).build(field)                            # once per tick, after update()
+    hits = field_spritecollide(field, ship, dokill=True, grid=grid)    # [slot, …]
+    destroyed = field_groupcollide(field, bullet_group, True, True, circle=True, grid=grid)
+                                                                        # {slot: [bullet, …]}
+
+Masks are only built when the narrow phase asks for one (see
+sprites.lazy_mask); every build goes through `mask_stats`:
+    mask = mask_stats.build(surface)
+    mask_stats.end_frame()                                  # → masks built this frame
+"""
+
+from __future__ import annotations
+import numpy as np
+import pygame
+
+CELL_SIZE = 64          # px – about the size of a big asteroid
+CIRCLE_FACTOR = 0.8     # circle radius = this × half the smaller rect side (rects of rotated sprites are padded)
+
+
+class MaskStats:
+    """Counts pygame.mask.from_surface calls, in total and per frame."""
+    def __init__(self):
+        self.total = 0
+        self.frame = 0          # built since the last end_frame()
+        self.last_frame = 0
+
+    def build(self, surface: pygame.Surface) -> pygame.mask.Mask:
+        self.total += 1
+        self.frame += 1
+        return pygame.mask.from_surface(surface)
+
+    def end_frame(self) -> int:
+        self.last_frame, self.frame = self.frame, 0
+        return self.last_frame
+
+
+mask_stats = MaskStats()
+
+
+def _radius(sprite) -> float:
+    r = getattr(sprite, "radius", None)
+    return r if r is not None else min(sprite.rect.width, sprite.rect.height) * 0.5 * CIRCLE_FACTOR
+
+
+class SpatialGrid:
+    """Field slots hashed into square cells by their rotated bounding box."""
+
+    def __init__(self, cell: int = CELL_SIZE):
+        self.cell = cell
+        self.cells: dict[tuple[int, int], list[int]] = {}
+        self.boxes: dict[int, tuple[float, float, float, float]] = {}
+
+    def build(self, field) -> SpatialGrid:
+        """Re-hash every alive slot of *field* from scratch (once per tick, after update())."""
+        idx, boxes = field.rects()
+        c = self.cell
+        lo = np.floor_divide(boxes[:, :2], c).astype(np.int32).tolist()
+        hi = np.floor_divide(boxes[:, 2:], c).astype(np.int32).tolist()
+        cells: dict[tuple[int, int], list[int]] = {}
+        for i, (x0, y0), (x1, y1) in zip(idx.tolist(), lo, hi):
+            for cx in range(x0, x1 + 1):
+                for cy in range(y0, y1 + 1):
+                    bucket = cells.get((cx, cy))
+                    if bucket is None:
+                        cells[(cx, cy)] = [i]
+                    else:
+                        bucket.append(i)
+        self.cells = cells
+        self.boxes = dict(zip(idx.tolist(), map(tuple, boxes.tolist())))
+        return self
+
+    def query(self, rect: pygame.Rect) -> list[int]:
+        """Hashed slots whose box overlaps *rect*."""
+        c, cells, boxes = self.cell, self.cells, self.boxes
+        found, seen = [], set()
+        for cx in range(rect.left // c, rect.right // c + 1):
+            for cy in range(rect.top // c, rect.bottom // c + 1):
+                for i in cells.get((cx, cy), ()):
+                    if i not in seen:
+                        seen.add(i)
+                        x0, y0, x1, y1 = boxes[i]
+                        if rect.left < x1 and rect.right > x0 and rect.top < y1 and rect.bottom > y0:
+                            found.append(i)
+        return found
+
+
+# ────────────────────────────────
+# Asteroid field
+# ────────────────────────────────
+def _field_hit(field, i: int, sprite, circle: bool) -> bool:
+    if not field.alive[i]:                      # killed earlier this tick (grid built before)
+        return False
+    if circle:
+        x, y = field.pos[i]
+        w, h = field.rect(i).size
+        dx, dy = sprite.rect.centerx - float(x), sprite.rect.centery - float(y)
+        r = min(w, h) * 0.5 * CIRCLE_FACTOR + _radius(sprite)
+        return dx * dx + dy * dy <= r * r
+    rect = field.rect(i)
+    return sprite.mask.overlap(field.mask(i), (rect.left - sprite.rect.left,
+                                               rect.top - sprite.rect.top)) is not None
+
+
+def field_spritecollide(field, sprite, dokill: bool = False, circle: bool = False,
+                        grid: SpatialGrid | None = None) -> list[int]:
+    """Field slots that touch *sprite*."""
+    grid = grid or SpatialGrid().build(field)
+    hits = [i for i in grid.query(sprite.rect) if _field_hit(field, i, sprite, circle)]
+    if dokill and hits:
+        field.kill(hits)
+    return hits
+
+
+def field_groupcollide(field, others, dokill_field: bool, dokill_others: bool,
+                       circle: bool = False, grid: SpatialGrid | None = None) -> dict[int, list]:
+    """
+    Like pygame.sprite.groupcollide(field, others, …): {slot: [other, …]}.
+    A killed *other* only counts once.
+    """
+    grid = grid or SpatialGrid().build(field)
+    result: dict[int, list] = {}
+    for o in list(others):
+        for i in grid.query(o.rect):
+            if _field_hit(field, i, o, circle):
+                result.setdefault(i, []).append(o)
+                if dokill_others:
+                    o.kill()
+                    break
+    if dokill_field and result:
+        field.kill(list(result))
+    return result
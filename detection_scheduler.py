@@ -0,0 +1,172 @@
+"""
+Adaptive detection scheduling.
+Full MediaPipe inference only runs every N frames; in between, the 21
+landmarks of each hand are carried forward with pyramidal Lucas-Kanade
+optical flow on the small detection frame. N shrinks when the hands move
+fast and grows when they are still or when inference is over budget, and
+any frame where tracking looks unreliable triggers inference at once.
+
+    scheduler = DetectionScheduler(detect_hands)
+    left, right = scheduler(frame_rgb)       # drop-in for detect_hands(frame_rgb)
+    scheduler.duty_cycle                     # fraction of frames that ran inference
+
+With a detection_worker.DetectionWorker the same schedule decides which
+frames are submitted; worker results (a frame or two old when they land)
+are flowed forward to the newest frame, and flow carries them in between:
+    (left, right), ts = scheduler.step_async(frame, worker)   # every game frame; frame: capture.Frame
+"""
+
+from __future__ import annotations
+import math, time
+import cv2, numpy as np
+
+from hand_state import HandState
+
+GRAY_HISTORY = 8          # recent detection-frame grays kept to flow late worker results forward
+
+MIN_INTERVAL = 1          # frames between inferences, fast motion
+MAX_INTERVAL = 6          # … hands at rest
+SEARCH_INTERVAL = 2       # while no hand is known, look for one every this many frames
+SLOW_MOTION = 0.5         # px/frame (detection frame) counted as "still"
+FAST_MOTION = 6.0         # px/frame counted as "fast"
+MIN_CONFIDENCE = 0.8      # fraction of landmarks that must track cleanly
+FB_MAX_ERROR = 1.0        # px – forward/backward flow disagreement allowed per point
+INFERENCE_BUDGET_MS = 8.0 # average inference time per frame we are willing to spend
+
+_LK_PARAMS = dict(winSize=(15, 15), maxLevel=2,
+                  criteria=(cv2.TERM_CRITERIA_EPS | cv2.TERM_CRITERIA_COUNT, 10, 0.03))
+
+
+class DetectionScheduler:
+    def __init__(self, detect, min_interval: int = MIN_INTERVAL, max_interval: int = MAX_INTERVAL,
+                 budget_ms: float = INFERENCE_BUDGET_MS):
+        self.detect = detect
+        self.min_interval, self.max_interval = min_interval, max_interval
+        self.budget_ms = budget_ms
+
+        self.interval = min_interval
+        self.infer_ms = 0.0                # EMA of inference time
+        self.motion = 0.0                  # EMA of landmark motion, px/frame
+        self.confidence = 1.0              # last tracking confidence
+        self.frames = self.inferences = 0
+
+        self._prev_gray = None
+        self._hands: tuple[HandState | None, HandState | None] = (None, None)
+        self._since = 0
+
+        # worker mode (step_async)
+        self._seq = -1                     # newest frame seen
+        self._grays: dict[int, np.ndarray] = {}      # frame seq → gray, last GRAY_HISTORY frames
+        self._result_seq = -1
+        self._ts = 0.0                     # capture time the current hands belong to
+
+    @property
+    def duty_cycle(self) -> float:
+        return self.inferences / self.frames if self.frames else 0.0
+
+    def __call__(self, frame_rgb):
+        self.frames += 1
+        self._since += 1
+        gray = cv2.cvtColor(frame_rgb, cv2.COLOR_RGB2GRAY)
+        known = any(h is not None for h in self._hands)
+
+        if self._since >= self.interval or self._prev_gray is None:
+            hands = self._infer(frame_rgb)
+        elif known:
+            hands = self._track(self._prev_gray, gray, self._hands) or self._infer(frame_rgb)
+        else:
+            hands = self._hands                 # searching: wait for the next scheduled inference
+        self._prev_gray = gray
+        self._hands = hands
+        self._adapt(any(h is not None for h in hands))
+        return hands
+
+    # ---------------------------------------------------------
+    def _infer(self, frame_rgb):
+        t0 = time.perf_counter()
+        hands = self.detect(frame_rgb)
+        self.infer_ms += 0.2 * ((time.perf_counter() - t0) * 1000 - self.infer_ms)
+        self.inferences += 1
+        self._since = 0
+        return hands
+
+    def step_async(self, frame, worker) -> tuple[tuple[HandState | None, HandState | None], float]:
+        """
+        Worker variant of __call__: submit *frame* only when inference is due,
+        otherwise carry the hands forward with optical flow. Returns the hands
+        and the capture time they belong to.
+        """
+        if frame is not None and frame.seq != self._seq:
+            self._seq = frame.seq
+            self.frames += 1
+            self._since += 1
+            gray = cv2.cvtColor(frame.rgb, cv2.COLOR_RGB2GRAY)
+            self._grays[frame.seq] = gray
+            if len(self._grays) > GRAY_HISTORY:
+                del self._grays[min(self._grays)]
+            tracked = None
+            if self._prev_gray is not None and any(h is not None for h in self._hands):
+                tracked = self._track(self._prev_gray, gray, self._hands)
+            if tracked is not None:
+                self._hands, self._ts = tracked, frame.timestamp
+            self._prev_gray = gray
+            due = self._since >= self.interval or tracked is None
+            if due and worker.submit(frame.rgb, frame.timestamp, frame.seq):
+                self._since = 0
+                self.inferences += 1
+            self._adapt(any(h is not None for h in self._hands))
+
+        hands = worker.latest()
+        if worker.result_seq != self._result_seq:           # a new detection landed
+            self._result_seq = worker.result_seq
+            self._hands, self._ts = hands, worker.result_ts
+            base = self._grays.get(self._result_seq)
+            if base is not None and self._prev_gray is not None and base is not self._prev_gray \
+                    and any(h is not None for h in hands):
+                tracked = self._track(base, self._prev_gray, hands,     # catch up to the newest frame
+                                      frames=max(1, self._seq - self._result_seq))
+                if tracked is not None:
+                    self._hands, self._ts = tracked, frame.timestamp if frame is not None else self._ts
+        return self._hands, self._ts
+
+    def _track(self, prev_gray, gray, hands, frames: int = 1):
+        """Flow every landmark of *hands* from prev_gray to gray (*frames* apart); None if unreliable."""
+        h, w = gray.shape
+        scale = np.array([w, h], np.float32)
+        present = [hand for hand in hands if hand is not None]
+        pts = np.concatenate([hand.landmarks[:, :2] * scale for hand in present]).reshape(-1, 1, 2)
+
+        nxt, st, _ = cv2.calcOpticalFlowPyrLK(prev_gray, gray, pts, None, **_LK_PARAMS)
+        back, st_b, _ = cv2.calcOpticalFlowPyrLK(gray, prev_gray, nxt, None, **_LK_PARAMS)
+        fb_err = np.linalg.norm((back - pts).reshape(-1, 2), axis=1)
+        good = (st.ravel() == 1) & (st_b.ravel() == 1) & (fb_err < FB_MAX_ERROR)
+        self.confidence = float(good.mean())
+        if self.confidence < MIN_CONFIDENCE:
+            return None
+
+        moved = (nxt - pts).reshape(-1, 2)
+        shift = np.median(moved[good], axis=0)
+        moved[~good] = shift                    # lost points follow the rest of the hand
+        self.motion += 0.3 * (float(np.hypot(*shift)) / frames - self.motion)
+
+        out, i = [], 0
+        for hand in hands:
+            if hand is None:
+                out.append(None)
+                continue
+            lms = hand.landmarks.copy()
+            lms[:, :2] += moved[i:i + 21] / scale
+            out.append(HandState(lms))
+            i += 21
+        return tuple(out)
+
+    def _adapt(self, have_hands: bool):
+        if not have_hands:
+            self.interval = SEARCH_INTERVAL
+            return
+        # motion: still → max_interval, fast → min_interval
+        k = min(1.0, max(0.0, (self.motion - SLOW_MOTION) / (FAST_MOTION - SLOW_MOTION)))
+        by_motion = self.max_interval - k * (self.max_interval - self.min_interval)
+        # budget: spread inference so its per-frame average stays within budget_ms
+        by_budget = math.ceil(self.infer_ms / self.budget_ms) if self.budget_ms else 1
+        self.interval = int(min(self.max_interval, max(self.min_interval, round(by_motion), by_budget)))
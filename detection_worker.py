@@ -0,0 +1,156 @@
+"""
+Hand detection in a separate process.
+The game copies each new RGB frame into a shared-memory buffer; the worker
+runs MediaPipe straight on that buffer (no pickling, no extra copy) and
+publishes both hands' landmarks into a small shared float array.
+
+Public API
+──────────
+    worker = DetectionWorker(max_side=256).start()   # frames up to 256×256
+    worker.wait_ready(timeout=60)              # model loaded in the worker process (RuntimeError if it died)
+    worker.submit(frame_rgb, timestamp, seq)   # ignored while the worker is busy
+    left, right = worker.latest()              # newest published result
+    worker.stop()
+"""
+
+from __future__ import annotations
+import multiprocessing as mproc, time
+from multiprocessing import shared_memory
+import numpy as np
+
+from hand_state import HandState
+
+N_LANDMARKS = 21
+_HAND_LEN = N_LANDMARKS * 3
+# result layout:  [seq, frame timestamp, has_left, has_right, left 21×3, right 21×3]
+_SEQ, _TS, _HAS_L, _HAS_R, _LEFT = 0, 1, 2, 3, 4
+_RIGHT = _LEFT + _HAND_LEN
+_RESULT_LEN = _RIGHT + _HAND_LEN
+
+
+# ────────────────────────────────
+# Worker process
+# ────────────────────────────────
+def _worker_main(shm_name, frame_shape, frame_seq, frame_ts, frame_ready, result, stop, ready):
+    from tracking import detect_hands, load_model
+    load_model()                                # this process's own MediaPipe model
+    ready.set()
+
+    shm = shared_memory.SharedMemory(name=shm_name)
+    out = np.frombuffer(result.get_obj(), dtype=np.float64)
+    try:
+        while not stop.is_set():
+            if not frame_ready.wait(0.1):
+                continue
+            frame_ready.clear()
+            seq, ts = frame_seq.value, frame_ts.value
+            frame = np.ndarray((frame_shape[0], frame_shape[1], 3), dtype=np.uint8, buffer=shm.buf)
+            left, right = detect_hands(frame)   # main won't write until we publish `seq`
+            del frame
+
+            with result.get_lock():
+                out[_HAS_L] = left is not None
+                out[_HAS_R] = right is not None
+                if left is not None:
+                    out[_LEFT:_RIGHT] = left.landmarks.ravel()
+                if right is not None:
+                    out[_RIGHT:] = right.landmarks.ravel()
+                out[_TS] = ts
+                out[_SEQ] = seq
+    finally:
+        shm.close()
+
+
+# ────────────────────────────────
+# Game-side handle
+# ────────────────────────────────
+class DetectionWorker:
+    def __init__(self, max_side: int = 256):
+        self.max_side = max_side
+        ctx = mproc.get_context("spawn")     # never fork a process that owns SDL / camera threads
+        self._shm = shared_memory.SharedMemory(create=True, size=max_side * max_side * 3)
+        self._buf = np.ndarray(max_side * max_side * 3, dtype=np.uint8, buffer=self._shm.buf)
+
+        self._frame_shape = ctx.Array("i", 2, lock=False)     # (h, w) of the frame in the buffer
+        self._frame_seq = ctx.Value("Q", 0, lock=False)
+        self._frame_ts = ctx.Value("d", 0.0, lock=False)
+        self._frame_ready = ctx.Event()
+        self._stop = ctx.Event()
+        self._ready = ctx.Event()
+        self._result = ctx.Array("d", _RESULT_LEN)
+        self._out = np.frombuffer(self._result.get_obj(), dtype=np.float64)
+
+        self._proc = ctx.Process(
+            target=_worker_main, name="hand-detection", daemon=True,
+            args=(self._shm.name, self._frame_shape, self._frame_seq, self._frame_ts,
+                  self._frame_ready, self._result, self._stop, self._ready))
+        self._submitted = 0
+        self._cached_seq = -1
+        self._cached = (None, None)
+        self.result_ts = 0.0          # capture timestamp of the frame behind latest()
+
+    # ---------------------------------------------------------
+    def start(self) -> DetectionWorker:
+        self._proc.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        self._proc.join(timeout=2.0)
+        if self._proc.is_alive():
+            self._proc.terminate()
+        del self._buf
+        self._shm.close()
+        self._shm.unlink()
+
+    @property
+    def ready(self) -> bool:
+        return self._ready.is_set()
+
+    def wait_ready(self, timeout: float | None = None, poll: float = 0.1) -> bool:
+        """
+        Block until the worker has loaded its model (True) or *timeout* runs
+        out (False); raises RuntimeError if the worker process dies first.
+        """
+        deadline = None if timeout is None else time.perf_counter() + timeout
+        while not self._ready.wait(poll):
+            if self._proc.exitcode is not None:
+                raise RuntimeError(f"detection worker exited with code {self._proc.exitcode}")
+            if deadline is not None and time.perf_counter() >= deadline:
+                return False
+        return True
+
+    @property
+    def busy(self) -> bool:
+        return self._submitted != int(self._out[_SEQ])
+
+    def submit(self, frame_rgb, timestamp: float, seq: int) -> bool:
+        """Hand *frame_rgb* to the worker; returns False if it is busy or already has *seq*."""
+        h, w = frame_rgb.shape[:2]
+        if seq == self._submitted or self.busy or max(h, w) > self.max_side:
+            return False
+        np.copyto(self._buf[:h * w * 3].reshape(h, w, 3), frame_rgb)
+        self._frame_shape[0], self._frame_shape[1] = h, w
+        self._frame_ts.value = timestamp
+        self._frame_seq.value = seq
+        self._submitted = seq
+        self._frame_ready.set()
+        return True
+
+    @property
+    def result_seq(self) -> int:
+        """Frame seq behind the last latest() result (-1 before the first)."""
+        return self._cached_seq
+
+    def latest(self):
+        """Return (left, right) HandStates from the newest finished detection."""
+        seq = int(self._out[_SEQ])
+        if seq != self._cached_seq:
+            with self._result.get_lock():
+                res = self._out.copy()
+            seq = int(res[_SEQ])
+            left = HandState(res[_LEFT:_RIGHT]) if res[_HAS_L] else None
+            right = HandState(res[_RIGHT:]) if res[_HAS_R] else None
+            self._cached_seq, self._cached = seq, (left, right)
+            self.result_ts = res[_TS]
+        return self._cached
@@ -0,0 +1,374 @@
+"""
+Game: owns the sprites, wave logic and per-frame loop.
+main.py builds one around the webcam; bench.py builds one around a
+scripted input under SDL's dummy video driver.
+
+Input objects need (see CameraInput below and input_sources.LandmarkStreamSource):
+    latest_frame() -> capture.Frame | None         (non-blocking)
+    hands(frame)   -> (left, right) hand_state.HandState | None
+    hands_ts       -> time.perf_counter() capture time behind the last hands() result
+
+Keys: SPACE start · R restart · F3 profiler graph · F4 debug shapes ·
+F5 export frame timings (CSV) · F6 start / stop a cProfile dump
+"""
+
+from __future__ import annotations
+import time
+import pygame
+from pygame import Vector2
+from pathlib import Path
+
+from sprites import Spaceship, Bullet, Explosion, ExplosionFrames
+from helpers import WebcamOverlay, draw_mask
+from asset_registry import registry
+from tracking import detect_hands, center_px, hand_is_open, FULL_VIEW
+from waveManager import WaveManager
+from menu_scene import MenuScene
+from profiling import NULL_TIMER, StageTimer, ProfilerOverlay, CProfileToggle
+from collision import SpatialGrid, field_spritecollide, field_groupcollide, mask_stats
+from asteroid_field import AsteroidField
+from sim_clock import sim_clock
+from renderer import Renderer
+from hud import Hud
+from pools import SpritePool
+
+
+# ───────────────────────────────────────────────
+# Config / paths
+# ───────────────────────────────────────────────
+WIDTH, HEIGHT = 750, 750
+BG_ZOOM = 1.1
+PARALLAX = (.02, .06, .10)          # per background layer, back to front
+WEBCAM_ALPHA = 35
+
+ASSETS = Path("assets")
+SHIP_FOLDER = ASSETS / "Engine"
+ASTEROID_FOLDER = ASSETS / "asteroid"
+BG0 = ASSETS / "backgrounds/Background layer 0.png"
+BG1 = ASSETS / "backgrounds/Background Layer 1.png"
+BG2 = ASSETS / "backgrounds/Background Layer 2.png"
+LOGO = ASSETS / "logo.png"
+
+# Menu hand-based start targets
+CIRCLE1_POS = Vector2(WIDTH // 3, HEIGHT // 2)
+CIRCLE2_POS = Vector2(2 * WIDTH // 3, HEIGHT // 2)
+CIRCLE_RADIUS = 80  # adjust based on your design
+
+CIRCLE_COLLISIONS = False   # asteroid-vs-bullet as circles instead of pixel masks
+
+BULLET_POOL = 48            # pre-built bullets (more are created – and counted as misses – if needed)
+EXPLOSION_POOL = 64         # pre-built explosions
+FIELD_CAPACITY = 256        # asteroid slots (the field's arrays double when full)
+
+MAX_FRAME_DT = 0.25         # s – longer stalls are not caught up (no spiral of death)
+MAX_TICKS_PER_FRAME = 5     # simulation steps run at most per rendered frame
+
+
+# ───────────────────────────────────────────────
+# Live webcam input
+# ───────────────────────────────────────────────
+class CameraInput:
+    """
+    Frames from a CameraCapture (over any input_sources frame source), hands
+    from a DetectionWorker or inline MediaPipe – optionally through a
+    detection_scheduler.DetectionScheduler. An optional
+    input_sources.LandmarkRecorder saves every new detection.
+    """
+
+    def __init__(self, capture, detector=None, recorder=None, scheduler=None):
+        self.capture = capture
+        self.detector = detector
+        self.recorder = recorder
+        self.scheduler = scheduler
+        self._detected_seq = 0
+        self.hands_ts = 0.0
+        self._recorded_ts = 0.0
+        self._hands = (None, None)
+
+    def latest_frame(self):
+        return self.capture.latest()
+
+    def hands(self, frame):
+        if self.detector is None:
+            if frame is not None and frame.seq != self._detected_seq:   # only run detection on new frames
+                self._detected_seq = frame.seq
+                self.hands_ts = frame.timestamp
+                self._hands = (self.scheduler or detect_hands)(frame.rgb)
+        elif self.scheduler is not None:              # submit on scheduled frames, optical flow between
+            self._hands, self.hands_ts = self.scheduler.step_async(frame, self.detector)
+        else:
+            if frame is not None:
+                self.detector.submit(frame.rgb, frame.timestamp, frame.seq)   # no-op while busy / already sent
+            self._hands = self.detector.latest()      # newest result, never waits
+            self.hands_ts = self.detector.result_ts
+
+        if self.recorder is not None and self.hands_ts != self._recorded_ts:
+            self.recorder.record(self.hands_ts, *self._hands)
+            self._recorded_ts = self.hands_ts
+        return self._hands
+
+    def close(self):
+        self.capture.stop()
+        self.capture.cam.release()
+        if self.detector is not None:
+            self.detector.stop()
+        if self.recorder is not None:
+            self.recorder.close()
+
+
+# ───────────────────────────────────────────────
+# Game
+# ───────────────────────────────────────────────
+class Game:
+    def __init__(self, screen: pygame.Surface, hand_input, debug: bool = False, timer=NULL_TIMER,
+                 hand_filter=None, show_webcam: bool = True, dirty_rects: bool = False,
+                 show_profiler: bool = False, seed: int | None = None):
+        self.screen = screen
+        self.input = hand_input
+        self.hand_filter = hand_filter      # hand_filter.HandFilter (smoothing + prediction) or None
+        self.debug = debug
+        self.show_webcam = show_webcam      # a webcam overlay forces full redraws every frame
+        self.timer = timer
+        self.profiler = ProfilerOverlay(timer) if isinstance(timer, StageTimer) else None
+        self.show_profiler = show_profiler and self.profiler is not None
+        self.cprofile = CProfileToggle()
+        self.running = True
+
+        # Fixed-timestep simulation ---------------------------------
+        self.clock = sim_clock
+        self.clock.reset()
+        self.accumulator = 0.0          # real seconds not yet simulated
+        self.alpha = 1.0                # render position between the last two ticks
+        self._last_step = None
+        self._prev_centers: dict = {}   # sprite → rect.center before the last tick
+
+        # Load graphics ---------------------------------------------
+        ship_images = registry.folder(SHIP_FOLDER, scale=(40, 60))
+        bg_size = (int(WIDTH*BG_ZOOM), int(HEIGHT*BG_ZOOM))
+        backgrounds = [registry.image(p, scale=bg_size) for p in (BG0, BG1, BG2)]
+        self.renderer = Renderer(screen, list(zip(backgrounds, PARALLAX)), dirty=dirty_rects)
+        self.explosion_frames = ExplosionFrames(registry.image(ASSETS / "effects/Explode.png"))  # per bucket, on first hit
+
+        # Sprite groups ---------------------------------------------
+        self.all_sprites = pygame.sprite.Group()
+        self.bullet_group = pygame.sprite.Group()
+        self.field = AsteroidField(WIDTH, HEIGHT, FIELD_CAPACITY)   # asteroids: NumPy slots, not sprites
+        self.grid = SpatialGrid()
+        # a recycled sprite must not interpolate from where its previous life ended
+        self.bullet_pool = SpritePool(Bullet, BULLET_POOL, on_acquire=self._forget_prev)
+        self.explosion_pool = SpritePool(
+            lambda: Explosion((0, 0), [self.explosion_frames.base], Vector2()), EXPLOSION_POOL, "explosion",
+            on_acquire=self._forget_prev)
+
+        self.ship = Spaceship((WIDTH//2, HEIGHT-80), ship_images, self.bullet_group, self.bullet_pool)
+        self.menu = MenuScene((WIDTH, HEIGHT), ASSETS/"menu")
+        self.overlay = WebcamOverlay((WIDTH, HEIGHT))
+        self.hud = Hud(WIDTH, HEIGHT)
+        self.all_sprites.add(self.ship)
+
+        # Wave logic ------------------------------------------------
+        self.wave_mgr = WaveManager(self.field, WIDTH, HEIGHT, ASTEROID_FOLDER, self.clock, seed)   # seed → same waves
+        self.wave_mgr.start_game()      # start in MENU state
+
+        # Camera state ----------------------------------------------
+        self.frame = None
+        self.last_frame_seq = 0
+        self.view = FULL_VIEW           # display crop inside the detection frame (camera → screen mapping)
+
+    # ---------------------------------------------------------
+    def handle_events(self):
+        for ev in pygame.event.get():
+            if ev.type == pygame.QUIT:
+                self.running = False
+
+            elif ev.type == pygame.KEYDOWN:
+                if ev.key == pygame.K_SPACE:  # start first wave from menu
+                    self.wave_mgr.launch_if_menu()
+                elif ev.key == pygame.K_r:  # restart after game-over
+                    self.wave_mgr.restart_if_gameover()
+                elif ev.key == pygame.K_F3 and self.profiler is not None:
+                    self.show_profiler = not self.show_profiler
+                elif ev.key == pygame.K_F4:
+                    self.debug = not self.debug
+                elif ev.key == pygame.K_F5 and isinstance(self.timer, StageTimer):
+                    self.hud.notify(f"Frame timings → {self.timer.export(time.strftime('profile-%Y%m%d-%H%M%S.csv'))}")
+                elif ev.key == pygame.K_F6:
+                    self.cprofile.toggle()
+
+    def step(self, dt: float | None = None):
+        """
+        One rendered frame: input → as many fixed simulation ticks as *dt*
+        (real seconds since the last call, measured if None) covers → draw → flip.
+        """
+        timer, wave_mgr = self.timer, self.wave_mgr
+        self.handle_events()
+
+        # Camera & hand detection ---------------------------------
+        with timer.section("capture"):
+            frame = self.frame = self.input.latest_frame()
+            if frame is not None and frame.seq != self.last_frame_seq:   # only redo work for new frames
+                self.last_frame_seq = frame.seq
+                self.view = frame.view
+                timer.record("blur", frame.blur_ms)                      # spent on the capture thread
+                if frame.blur_detect_ms:
+                    timer.record("blur_detect", frame.blur_detect_ms)
+                if self.show_webcam:
+                    self.overlay.update(frame.bgr)
+        with timer.section("detect"):
+            left_hand, right_hand = self.input.hands(frame)
+            if self.hand_filter is not None:
+                left_hand, right_hand = self.hand_filter(left_hand, right_hand,
+                                                         self.input.hands_ts, time.perf_counter())
+
+        # Menu hand-based start -----------------------------------
+        if wave_mgr.state == "MENU" and left_hand and right_hand:
+            left_pos = center_px(left_hand, WIDTH, HEIGHT, self.view)
+            right_pos = center_px(right_hand, WIDTH, HEIGHT, self.view)
+
+            if (hand_is_open(left_hand) and hand_is_open(right_hand) and
+                    (left_pos - CIRCLE1_POS).length() < CIRCLE_RADIUS and
+                    (right_pos - CIRCLE2_POS).length() < CIRCLE_RADIUS):
+                wave_mgr.launch_if_menu()
+
+        # Fixed-timestep simulation -------------------------------
+        for _ in range(self._ticks_due(dt)):
+            with timer.section("update"):
+                self._simulate(left_hand, right_hand)
+            with timer.section("collide"):
+                self._collide()
+        self.alpha = self.accumulator / self.clock.dt
+
+        with timer.section("draw"):
+            self._draw()
+        with timer.section("flip"):
+            self.renderer.present()
+        mask_stats.end_frame()          # masks built this frame → mask_stats.last_frame
+
+    def run(self, fps: int = 60):
+        """Render at up to *fps*; the simulation keeps its own rate (sim_clock.SIM_HZ)."""
+        clock = pygame.time.Clock()
+        while self.running:
+            self.step()
+            self.timer.end_frame()
+            clock.tick(fps)
+            self.timer.restart_frame()
+
+    @property
+    def pools(self) -> tuple:
+        """Everything with pool hit / miss counters (the field's slots included)."""
+        return self.bullet_pool, self.explosion_pool, self.field
+
+    # ---------------------------------------------------------
+    def _ticks_due(self, dt: float | None) -> int:
+        now = time.perf_counter()
+        if dt is None:
+            dt = now - self._last_step if self._last_step is not None else self.clock.dt
+        self._last_step = now
+        self.accumulator += min(dt, MAX_FRAME_DT)
+        ticks = int(self.accumulator / self.clock.dt)
+        self.accumulator -= ticks * self.clock.dt
+        if ticks > MAX_TICKS_PER_FRAME:           # too far behind: drop the backlog
+            ticks, self.accumulator = MAX_TICKS_PER_FRAME, 0.0
+        return ticks
+
+    def _simulate(self, left_hand, right_hand):
+        """One fixed tick: hands → ship, then everything moves by one step."""
+        ship = self.ship
+        self._prev_centers = {s: s.rect.center for group in (self.all_sprites, self.bullet_group)
+                              for s in group}
+        self.clock.advance()
+        ship.move(left_hand, WIDTH, HEIGHT, self.view)
+        ship.shoot(right_hand, WIDTH, HEIGHT, self.view)
+
+        self.all_sprites.update()
+        self.field.update()
+        self.bullet_group.update()
+        self.wave_mgr.update(player_alive=ship.health > 0)
+
+    def _forget_prev(self, sprite):
+        self._prev_centers.pop(sprite, None)
+
+    def _draw_group(self, group) -> list[pygame.Rect]:
+        """Blit *group* at positions interpolated between the last two ticks."""
+        a, prev = self.alpha, self._prev_centers
+        blits = []
+        for s in group:
+            x1, y1 = s.rect.center
+            x0, y0 = prev.get(s, (x1, y1))
+            blits.append((s.image, s.image.get_rect(center=(round(x0 + (x1 - x0) * a),
+                                                            round(y0 + (y1 - y0) * a)))))
+        return self.screen.blits(blits)
+
+    # ---------------------------------------------------------
+    def _collide(self):
+        ship, field = self.ship, self.field
+        grid = self.grid.build(field)                   # broad phase: field slots hashed into cells
+        if field_spritecollide(field, ship, dokill=True, grid=grid):
+            ship.hit()
+
+        destroyed = field_groupcollide(field, self.bullet_group, True, True, circle=CIRCLE_COLLISIONS,
+                                       grid=grid)
+
+        for i in destroyed.keys():
+            # Use the asteroid's last size, velocity and spin (the slot is free but not yet reused)
+            w, h = field.size[i].tolist()
+            explosion = self.explosion_pool.acquire(
+                pos=field.rect(i).center,
+                frames=self.explosion_frames.get(max(w, h), float(field.spin[i])),
+                velocity=Vector2(*field.vel[i].tolist()),
+            )
+            self.all_sprites.add(explosion)
+
+        ship.score += len(destroyed)
+
+    def _draw(self):
+        screen, ship, frame, renderer = self.screen, self.ship, self.frame, self.renderer
+        webcam = self.overlay if self.show_webcam and frame is not None else None
+        menu = self.wave_mgr.state == "MENU"
+
+        # Cached parallax composite; dirty-rect frames only restore what moved
+        renderer.begin(ship.rect.center, full=webcam is not None or menu or self.debug)
+        if webcam is not None:
+            webcam.draw(screen, WEBCAM_ALPHA)
+
+        # Draw asteroids, then all sprites on top (interpolated between ticks)
+        renderer.mark(self.field.draw(screen, self.alpha))
+        renderer.mark(self._draw_group(self.all_sprites))
+        renderer.mark(self._draw_group(self.bullet_group))
+
+        # Debug: draw bounding boxes and masks
+        debug_line = None
+        if self.debug:
+            draw_mask(screen, ship.mask, ship.rect.topleft)
+            for i in self.field.rects()[0].tolist():
+                rect = self.field.rect(i)
+                draw_mask(screen, self.field.mask(i), rect.topleft)
+                pygame.draw.rect(screen, (255, 0, 0), rect, 2)
+            for sprite in self.all_sprites:
+                pygame.draw.rect(screen, (255, 0, 0), sprite.rect, 2)
+            for bullet in self.bullet_group:
+                bullet.draw_debug(screen)
+            info = [f'masks built {mask_stats.last_frame}/frame', '  '.join(map(str, self.pools))]
+            if frame is not None and hasattr(self.input, "capture"):
+                info.append(f'cam: frame age {frame.age * 1000:.0f} ms   dropped {self.input.capture.dropped}')
+            if self.hand_filter is not None:
+                info.append(f'input latency ≈ {self.hand_filter.latency * 1000:.0f} ms')
+            debug_line = '   '.join(info)
+
+        # HUD + wave / cooldown text (cached text surfaces)
+        renderer.mark(self.hud.draw(screen, ship.health, ship.score, self.wave_mgr.hud_text(), debug_line))
+
+        # Game Instructions (only on MENU screen)
+        if menu:
+            self.menu.update()
+            self.menu.draw(screen, overlay=webcam)
+            loading = getattr(self.input, "loader", None)
+            if loading is not None and (not loading.done or loading.error is not None):
+                renderer.mark(self.hud.draw_progress(screen, loading.progress, loading.status))
+            if self.debug:      # the hand-start target circles
+                pygame.draw.circle(screen, (0, 255, 0), CIRCLE1_POS, CIRCLE_RADIUS, 3)
+                pygame.draw.circle(screen, (0, 255, 0), CIRCLE2_POS, CIRCLE_RADIUS, 3)
+
+        # Profiler graph (F3)
+        if self.show_profiler:
+            renderer.mark(self.profiler.draw(screen, (WIDTH - self.profiler.w - 10, 10)))
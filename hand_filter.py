@@ -0,0 +1,85 @@
+"""
+Landmark smoothing + latency compensation.
+
+Each hand's (21, 3) landmarks go through a One Euro filter (heavy smoothing
+when the hand is still, light when it moves fast). The filtered velocity is
+then used to extrapolate to the moment the frame is drawn, hiding the
+capture + inference delay.
+
+    hand_filter = HandFilter(min_cutoff=1.5, beta=8.0, max_lead=0.1)
+    left, right = hand_filter(left, right, sample_ts, now)   # both time.perf_counter() seconds
+    hand_filter.latency                                      # smoothed sample→render delay (s)
+"""
+
+from __future__ import annotations
+import math
+import numpy as np
+
+from hand_state import HandState
+
+MIN_CUTOFF = 1.5      # Hz – jitter removal at rest (lower = smoother, laggier)
+BETA = 8.0            # how fast the cutoff rises with speed (higher = less lag when moving)
+D_CUTOFF = 1.0        # Hz – smoothing of the velocity estimate
+MAX_LEAD = 0.1        # s  – never extrapolate further ahead than this
+
+
+def _alpha(dt: float, cutoff):
+    return 1.0 / (1.0 + 1.0 / (2 * math.pi * cutoff * dt))
+
+
+class OneEuroFilter:
+    """Elementwise One Euro filter over a NumPy array."""
+
+    def __init__(self, min_cutoff: float = MIN_CUTOFF, beta: float = BETA, d_cutoff: float = D_CUTOFF):
+        self.min_cutoff, self.beta, self.d_cutoff = min_cutoff, beta, d_cutoff
+        self.reset()
+
+    def reset(self):
+        self.x = self.dx = None
+        self.t = None
+
+    def __call__(self, x: np.ndarray, t: float) -> np.ndarray:
+        if self.x is None:
+            self.x, self.dx, self.t = x.copy(), np.zeros_like(x), t
+            return self.x
+        dt = t - self.t
+        if dt <= 0:
+            return self.x
+        a_d = _alpha(dt, self.d_cutoff)
+        self.dx = a_d * (x - self.x) / dt + (1 - a_d) * self.dx
+        a = _alpha(dt, self.min_cutoff + self.beta * np.abs(self.dx))
+        self.x = a * x + (1 - a) * self.x
+        self.t = t
+        return self.x
+
+
+class HandFilter:
+    """Filters + predicts both hands; a hand that disappears starts fresh when it returns."""
+
+    def __init__(self, min_cutoff: float = MIN_CUTOFF, beta: float = BETA,
+                 d_cutoff: float = D_CUTOFF, max_lead: float = MAX_LEAD, predict: bool = True):
+        self.filters = (OneEuroFilter(min_cutoff, beta, d_cutoff),
+                        OneEuroFilter(min_cutoff, beta, d_cutoff))
+        self.max_lead = max_lead
+        self.predict = predict
+        self.latency = 0.0          # EMA of render time − sample time (s)
+        self._sample_ts = None
+
+    def __call__(self, left: HandState | None, right: HandState | None,
+                 sample_ts: float, now: float) -> tuple[HandState | None, HandState | None]:
+        new_sample = sample_ts != self._sample_ts
+        self._sample_ts = sample_ts
+        lag = max(0.0, now - sample_ts)
+        self.latency += 0.05 * (lag - self.latency)
+        return (self._one(0, left, sample_ts, new_sample, lag),
+                self._one(1, right, sample_ts, new_sample, lag))
+
+    def _one(self, i: int, hand: HandState | None, ts: float, new_sample: bool, lag: float):
+        f = self.filters[i]
+        if hand is None:
+            f.reset()
+            return None
+        x = f(hand.landmarks, ts) if new_sample or f.x is None else f.x
+        if self.predict:
+            x = x + f.dx * min(lag, self.max_lead)
+        return HandState(x)
@@ -0,0 +1,80 @@
+"""
+HandState: one detected hand as a (21, 3) float32 array of normalised
+MediaPipe landmarks, plus gesture features computed once, vectorised.
+No MediaPipe import needed, so the detection worker, landmark streams and
+sprites can all share it.
+
+    hand = HandState(landmarks)            # (21, 3) x, y, z in 0‥1 image coords
+    hand.centroid                          # (x, y) mean of all landmarks
+    hand.is_open / hand.is_fist            # shoot / closed-fist gestures
+    hand.openness                          # 0 (fist) … 1 (all four fingers out)
+    hand.palm_angle                        # degrees, 0 = fingers pointing up
+    hand.pinch                             # thumb–index tip gap / palm size
+    hand.features()                        # the scalars above as float32[FEATURES]
+"""
+
+from __future__ import annotations
+import numpy as np
+
+# MediaPipe landmark indices
+WRIST = 0
+THUMB_TIP = 4
+INDEX_MCP, INDEX_PIP, INDEX_TIP = 5, 6, 8
+MIDDLE_MCP, MIDDLE_PIP, MIDDLE_TIP = 9, 10, 12
+RING_MCP, RING_PIP, RING_TIP = 13, 14, 16
+PINKY_MCP, PINKY_PIP, PINKY_TIP = 17, 18, 20
+
+FINGER_TIPS = np.array([INDEX_TIP, MIDDLE_TIP, RING_TIP, PINKY_TIP])
+FINGER_PIPS = np.array([INDEX_PIP, MIDDLE_PIP, RING_PIP, PINKY_PIP])
+PALM_BASE = np.array([WRIST, INDEX_MCP, MIDDLE_MCP, RING_MCP, PINKY_MCP])
+
+FIST_RADIUS = 1.0     # fingertips within this many palm sizes of the palm centre → fist
+OPEN_RADIUS = 1.8     # … and about this far out when the finger is straight
+
+FEATURES = ("centroid_x", "centroid_y", "openness", "palm_angle", "pinch", "is_open", "is_fist")
+
+
+class HandState:
+    __slots__ = ("landmarks", "centroid", "openness", "palm_angle", "palm_normal",
+                 "palm_size", "pinch", "is_open", "is_fist")
+
+    def __init__(self, landmarks):
+        lms = self.landmarks = np.asarray(landmarks, dtype=np.float32).reshape(21, 3)
+        xy = lms[:, :2]
+        self.centroid = xy.mean(axis=0)
+
+        # Fingers: tip above its PIP joint (image y grows downwards), thumb ignored
+        extended = xy[FINGER_TIPS, 1] < xy[FINGER_PIPS, 1]
+        self.is_open = bool(extended.all())
+
+        # Palm: base landmarks give a centre, a size and an orientation
+        palm = xy[PALM_BASE]
+        palm_center = palm.mean(axis=0)
+        up = xy[MIDDLE_MCP] - xy[WRIST]
+        self.palm_size = max(float(np.hypot(*up)), 1e-6)
+        self.palm_angle = float(np.degrees(np.arctan2(up[0], -up[1])))
+        normal = np.cross(lms[INDEX_MCP] - lms[WRIST], lms[PINKY_MCP] - lms[WRIST])
+        self.palm_normal = normal / max(float(np.linalg.norm(normal)), 1e-9)
+
+        # Fist: every fingertip curled back near the palm centre (rotation-independent)
+        tip_dist = np.hypot(*(xy[FINGER_TIPS] - palm_center).T) / self.palm_size
+        self.is_fist = bool((tip_dist < FIST_RADIUS).all())
+        # Openness: where each fingertip sits between curled and straight, averaged
+        reach = (tip_dist - FIST_RADIUS) / (OPEN_RADIUS - FIST_RADIUS)
+        self.openness = float(np.clip(reach, 0, 1).mean())
+
+        self.pinch = float(np.hypot(*(xy[THUMB_TIP] - xy[INDEX_TIP]))) / self.palm_size
+
+    def point(self, index: int) -> tuple[float, float]:
+        """Normalised (x, y) of one landmark."""
+        return float(self.landmarks[index, 0]), float(self.landmarks[index, 1])
+
+    def features(self) -> np.ndarray:
+        """Scalar features in FEATURES order (for logging / replay)."""
+        return np.array([self.centroid[0], self.centroid[1], self.openness, self.palm_angle,
+                         self.pinch, self.is_open, self.is_fist], dtype=np.float32)
+
+    def __repr__(self):
+        x, y = self.centroid
+        return (f"HandState(centroid=({x:.3f}, {y:.3f}), open={self.is_open}, "
+                f"fist={self.is_fist}, openness={self.openness:.2f})")
@@ -45,13 +45,28 @@ def parallax_offset(ship_pos: Vector2, factor: float,
     center_y = -(bg_size[1] - screen_h) // 2
     return center_x - int(dx * factor), center_y - int(dy * factor)
 
-def webcam_surface_with_alpha(frame_bgr, alpha_val: int = 50) -> pygame.Surface:
-    """Convert OpenCV BGR frame → semi-transparent Pygame surface."""
-    frame_rgb = cv2.cvtColor(frame_bgr, cv2.COLOR_BGR2RGB)
-    h, w = frame_rgb.shape[:2]
-    alpha = np.full((h, w, 1), alpha_val, np.uint8)
-    frame_rgba = np.concatenate((frame_rgb, alpha), axis=2)
-    return pygame.image.frombuffer(frame_rgba.tobytes(), (w, h), "RGBA").convert_alpha()
+class WebcamOverlay:
+    """
+    Semi-transparent webcam layer. The surface is created once on top of a
+    preallocated RGB buffer; `update()` writes each frame into that buffer in
+    place, and transparency is a surface-level alpha set at draw time.
+    """
+    def __init__(self, size: tuple[int, int]):
+        w, h = size
+        self._rgb = np.zeros((h, w, 3), np.uint8)
+        self._resized = np.empty((h, w, 3), np.uint8)           # only used if frames differ in size
+        self.surface = pygame.image.frombuffer(self._rgb, (w, h), "RGB")   # shares self._rgb
+
+    def update(self, frame_bgr):
+        """Copy an OpenCV BGR frame into the overlay (no allocations)."""
+        h, w = self._rgb.shape[:2]
+        if frame_bgr.shape[:2] != (h, w):
+            frame_bgr = cv2.resize(frame_bgr, (w, h), dst=self._resized)
+        cv2.cvtColor(frame_bgr, cv2.COLOR_BGR2RGB, dst=self._rgb)
+
+    def draw(self, target: pygame.Surface, alpha: int, pos=(0, 0)):
+        self.surface.set_alpha(alpha)
+        target.blit(self.surface, pos)
 
 def draw_mask(surface, mask, offset):
     for x in range(mask.get_size()[0]):
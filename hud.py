@@ -0,0 +1,118 @@
+"""
+HUD text: fonts are opened once, rendered strings are cached by
+(font, text, colour) in a small LRU, and each HUD field only looks its
+surface up again when its text actually changes.
+
+Public API
+──────────
+    from hud import text_cache, Hud
+    surf = text_cache.render("GAME OVER", 36, (255, 255, 0))     # cached
+    hud = Hud(screen_w, screen_h)
+    rects = hud.draw(screen, health=3, score=12, status="WAVE 2   9s", debug_line=None)
+    rect = hud.draw_progress(screen, 0.5, "open camera")          # start-up loading bar
+    hud.notify("Frame timings → profile.csv")                    # shown by draw() for NOTICE_TIME s
+"""
+
+from __future__ import annotations
+from collections import OrderedDict
+import time
+import pygame
+
+MAX_TEXTS = 64           # rendered strings kept before LRU eviction
+NOTICE_TIME = 3.0        # s a notify() message stays on screen
+
+
+class TextCache:
+    def __init__(self, max_texts: int = MAX_TEXTS):
+        self.max_texts = max_texts
+        self._fonts: dict[tuple[str | None, int], pygame.font.Font] = {}
+        self._texts: OrderedDict[tuple, pygame.Surface] = OrderedDict()
+        self.hits = self.misses = 0
+
+    def font(self, size: int, name: str | None = None) -> pygame.font.Font:
+        key = (name, size)
+        f = self._fonts.get(key)
+        if f is None:
+            f = self._fonts[key] = pygame.font.SysFont(name, size)
+        return f
+
+    def render(self, text: str, size: int, color, name: str | None = None) -> pygame.Surface:
+        key = (name, size, text, tuple(color))
+        surf = self._texts.get(key)
+        if surf is not None:
+            self.hits += 1
+            self._texts.move_to_end(key)
+            return surf
+        self.misses += 1
+        surf = self._texts[key] = self.font(size, name).render(text, True, color)
+        if len(self._texts) > self.max_texts:
+            self._texts.popitem(last=False)
+        return surf
+
+    def clear(self):
+        self._fonts.clear()
+        self._texts.clear()
+
+
+text_cache = TextCache()
+
+
+class HudField:
+    """One line of HUD text; `set()` is cheap when the text hasn't changed."""
+
+    def __init__(self, size: int, color, cache: TextCache = text_cache):
+        self.size, self.color, self.cache = size, color, cache
+        self.text: str | None = None
+        self.surface: pygame.Surface | None = None
+
+    def set(self, text: str) -> pygame.Surface | None:
+        if text != self.text:
+            self.text = text
+            self.surface = self.cache.render(text, self.size, self.color) if text else None
+        return self.surface
+
+
+class Hud:
+    def __init__(self, screen_w: int, screen_h: int, cache: TextCache = text_cache):
+        self.W, self.H = screen_w, screen_h
+        self.stats = HudField(28, (255, 255, 255), cache)
+        self.status = HudField(36, (255, 255, 0), cache)
+        self.debug = HudField(22, (0, 255, 0), cache)
+        self.loading = HudField(22, (200, 200, 200), cache)
+        self.notice = HudField(22, (255, 255, 255), cache)
+        self._notice_until = 0.0
+
+    def notify(self, text: str, seconds: float = NOTICE_TIME):
+        """Short on-screen message (e.g. where an export was written)."""
+        self.notice.set(text)
+        self._notice_until = time.perf_counter() + seconds
+
+    def draw(self, screen: pygame.Surface, health: int, score: int, status: str = "",
+             debug_line: str | None = None) -> list[pygame.Rect]:
+        """Blit every field; returns the rects drawn (for dirty-rect rendering)."""
+        rects = [screen.blit(self.stats.set(f'Health: {health}   Score: {score}'), (10, 10))]
+        surf = self.status.set(status)
+        if surf is not None:
+            rects.append(screen.blit(surf, (self.W // 2 - surf.get_width() // 2, 40)))
+        surf = self.debug.set(debug_line or "")
+        if surf is not None:
+            rects.append(screen.blit(surf, (10, self.H - 24)))
+        if self.notice.surface is not None:
+            if time.perf_counter() < self._notice_until:
+                surf = self.notice.surface
+                rects.append(screen.blit(surf, (self.W - surf.get_width() - 10, self.H - 24)))
+            else:
+                self.notice.set("")
+        return rects
+
+    def draw_progress(self, screen: pygame.Surface, progress: float, status: str) -> pygame.Rect:
+        """Loading bar + current phase, bottom centre (shown on the menu during start-up)."""
+        w, h = 300, 8
+        bar = pygame.Rect(self.W // 2 - w // 2, self.H - 60, w, h)
+        pygame.draw.rect(screen, (60, 60, 60), bar)
+        pygame.draw.rect(screen, (120, 200, 255), (bar.x, bar.y, round(w * min(progress, 1.0)), h))
+        rect = bar.copy()
+        surf = self.loading.set(status)
+        if surf is not None:
+            rect.union_ip(screen.blit(surf, (self.W // 2 - surf.get_width() // 2, bar.bottom + 6)))
+        return rect
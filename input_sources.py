@@ -0,0 +1,200 @@
+"""
+Input sources.
+
+Frame sources look like cv2.VideoCapture (`read()` → (ok, bgr), `release()`),
+so they plug straight into tracking.grab_frame / capture.CameraCapture:
+    CameraSource(0)                          live webcam
+    VideoFileSource("clip.mp4")              replayed at the file's fps (or as fast as possible)
+    ImageDirSource("frames/", fps=30)        sorted .png/.jpg files
+
+Landmark streams skip the camera *and* MediaPipe; they are a Game input
+(`latest_frame()` / `hands()`), replaying hands recorded from a real session:
+    LandmarkRecorder("session.hlm")          record(timestamp, left, right) per detection
+    LandmarkStreamSource("session.hlm")      replay
+
+Stream file format (little-endian):
+    header  b"HLM1"
+    record  float64 seconds since recording start, uint8 flags (1 = left, 2 = right),
+            then float32[21, 3] for each hand present (left first)
+"""
+
+from __future__ import annotations
+import os, struct, time
+import cv2, numpy as np
+
+from hand_state import HandState
+
+N_LANDMARKS = 21
+_MAGIC = b"HLM1"
+_REC_HEAD = struct.Struct("<dB")
+_HAND_BYTES = N_LANDMARKS * 3 * 4
+
+
+# ────────────────────────────────
+# Frame sources
+# ────────────────────────────────
+class CameraSource:
+    def __init__(self, index: int = 0):
+        self.cap = cv2.VideoCapture(index)
+
+    def read(self):
+        return self.cap.read()
+
+    def release(self):
+        self.cap.release()
+
+
+class _PacedSource:
+    """Shared pacing: with *realtime*, frames come out no faster than *fps*."""
+    def __init__(self, fps: float, realtime: bool):
+        self.frame_dt = 1 / fps if fps > 0 else 0
+        self.realtime = realtime
+        self._next_at = 0.0
+
+    def _wait_turn(self):
+        if not self.realtime or not self.frame_dt:
+            return
+        now = time.perf_counter()
+        if now < self._next_at:
+            time.sleep(self._next_at - now)
+        self._next_at = max(now, self._next_at) + self.frame_dt
+
+
+class VideoFileSource(_PacedSource):
+    def __init__(self, path, loop: bool = True, realtime: bool = True):
+        self.cap = cv2.VideoCapture(str(path))
+        if not self.cap.isOpened():
+            raise FileNotFoundError(f'Cannot open video “{path}”.')
+        super().__init__(self.cap.get(cv2.CAP_PROP_FPS) or 30, realtime)
+        self.loop = loop
+
+    def read(self):
+        self._wait_turn()
+        ok, frame = self.cap.read()
+        if not ok and self.loop:
+            self.cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
+            ok, frame = self.cap.read()
+        return ok, frame
+
+    def release(self):
+        self.cap.release()
+
+
+class ImageDirSource(_PacedSource):
+    def __init__(self, folder, fps: float = 30, loop: bool = True, realtime: bool = True):
+        super().__init__(fps, realtime)
+        supported = ('.png', '.jpg', '.jpeg')
+        self.files = sorted(os.path.join(folder, f) for f in os.listdir(folder)
+                            if f.lower().endswith(supported))
+        if not self.files:
+            raise FileNotFoundError(f'No images found in “{folder}”.')
+        self.loop = loop
+        self._i = 0
+
+    def read(self):
+        if self._i >= len(self.files):
+            if not self.loop:
+                return False, None
+            self._i = 0
+        self._wait_turn()
+        frame = cv2.imread(self.files[self._i])
+        self._i += 1
+        return frame is not None, frame
+
+    def release(self):
+        pass
+
+
+# ────────────────────────────────
+# Landmark streams
+# ────────────────────────────────
+class LandmarkRecorder:
+    def __init__(self, path):
+        self._f = open(path, "wb")
+        self._f.write(_MAGIC)
+        self._t0 = None
+
+    def record(self, timestamp: float, left, right):
+        """*left* / *right*: HandState or None."""
+        if self._t0 is None:
+            self._t0 = timestamp
+        flags = (left is not None) | (right is not None) << 1
+        self._f.write(_REC_HEAD.pack(timestamp - self._t0, flags))
+        for hand in (left, right):
+            if hand is not None:
+                self._f.write(hand.landmarks.astype("<f4").tobytes())
+
+    def close(self):
+        self._f.close()
+
+
+def read_landmark_stream(path) -> list[tuple[float, np.ndarray | None, np.ndarray | None]]:
+    """Whole file → [(t, left (21, 3) | None, right (21, 3) | None), …]."""
+    with open(path, "rb") as f:
+        data = f.read()
+    if data[:4] != _MAGIC:
+        raise ValueError(f'“{path}” is not a landmark stream.')
+    records, pos = [], 4
+    while pos + _REC_HEAD.size <= len(data):
+        t, flags = _REC_HEAD.unpack_from(data, pos)
+        pos += _REC_HEAD.size
+        hands = []
+        for bit in (1, 2):
+            if flags & bit:
+                hands.append(np.frombuffer(data, "<f4", N_LANDMARKS * 3, pos).reshape(N_LANDMARKS, 3))
+                pos += _HAND_BYTES
+            else:
+                hands.append(None)
+        records.append((t, *hands))
+    return records
+
+
+class LandmarkStreamSource:
+    """
+    Game input that replays a recorded stream instead of running a camera +
+    detector. With *realtime* the recording's own timing is followed,
+    otherwise each call advances one record (as fast as the loop runs).
+    """
+    def __init__(self, path, loop: bool = True, realtime: bool = True):
+        self.records = read_landmark_stream(path)
+        if not self.records:
+            raise ValueError(f'“{path}” has no records.')
+        self.loop = loop
+        self.realtime = realtime
+        self._i = -1
+        self._t0 = None
+        self._cached_i = None
+        self._hands = (None, None)
+        self.hands_ts = 0.0                            # perf_counter time the current record "happened"
+
+    def latest_frame(self):
+        return None                                    # no camera image behind a stream
+
+    def hands(self, frame):
+        if self.realtime:
+            now = time.perf_counter()
+            if self._t0 is None:
+                self._t0 = now
+            elapsed = now - self._t0
+            duration = self.records[-1][0]
+            if elapsed > duration and self.loop and duration > 0:
+                self._t0 += duration * (elapsed // duration)
+                elapsed -= duration * (elapsed // duration)
+                self._i = -1
+            while self._i + 1 < len(self.records) and self.records[self._i + 1][0] <= elapsed:
+                self._i += 1
+        else:
+            self._i += 1
+            if self._i >= len(self.records):
+                self._i = 0 if self.loop else len(self.records) - 1
+
+        if self._i != self._cached_i and self._i >= 0:
+            t, left, right = self.records[self._i]
+            self.hands_ts = self._t0 + t if self.realtime else time.perf_counter()
+            self._hands = (HandState(left) if left is not None else None,
+                           HandState(right) if right is not None else None)
+            self._cached_i = self._i
+        return self._hands
+
+    def close(self):
+        pass
@@ -3,9 +3,10 @@ MenuScene
 ─────────
 • Draws four background layers with the requested behaviour:
     layer1 – static
-    layer2 – slow ±5° rotation, fades out
+    layer2 – slow ±5° rotation (pre-rotated frames, built by reset(), freed once faded), fades out
     layer3 – shows first, fades out after delay
     layer4 – fades in after 2+3 are gone
+• Layers whose file is missing are skipped (the game background shows through).
 • Shows instructions & handles SPACE (start) + R (restart after game-over).
 
 Public API
@@ -13,28 +14,47 @@ Public API
     menu = MenuScene(screen_size, assets_path)
     menu.reset()                 # call when you re-enter the menu
     menu.handle_event(event)     # returns True if it consumed SPACE / R
-    menu.update()                # per-frame book-keeping
-    menu.draw(target_surface)    # draw everything
+    menu.update()                # fade state from the time since reset()
+    menu.draw(target_surface, overlay)   # draw everything (overlay: helpers.WebcamOverlay)
 """
 
 from __future__ import annotations
 import pygame, math, pathlib
 
+from asset_registry import registry
+
+FADE_DELAY = 2.0         # s before layers 2 + 3 start fading out
+FADE_TIME = 0.85         # s for each fade (out, then layer 4 in)
+SWAY_DEG = 5.0           # layer 2 rotation amplitude …
+SWAY_PERIOD = 3.0        # … angle = SWAY_DEG · sin(t / SWAY_PERIOD)
+ROTATION_STEP = 0.25     # degrees between pre-rotated layer-2 frames
+
+
 class MenuScene:
     def __init__(self, size: tuple[int,int], menu_asset_dir: pathlib.Path):
         self.W, self.H = size
         # ─ load layers ─
-        self.bg1 = pygame.transform.scale(pygame.image.load(menu_asset_dir/"Title Layer 0.png"), size)
-        self.bg2 = pygame.transform.scale(pygame.image.load(menu_asset_dir/"Title Layer 1.png"), size)
-        self.bg3 = pygame.transform.scale(pygame.image.load(menu_asset_dir/"Title Layer 2.png"), size)
-        self.bg4 = pygame.transform.scale(pygame.image.load(menu_asset_dir/"Title Layer 3.png"), size)
+        self.bg1 = self._load(menu_asset_dir/"Title Layer 0.png")
+        self.bg2 = self._load(menu_asset_dir/"Title Layer 1.png")
+        self.bg3 = self._load(menu_asset_dir/"Title Layer 2.png")
+        self.bg4 = self._load(menu_asset_dir/"Title Layer 3.png")
+        self._bg2_frames: dict[int, pygame.Surface] = {}      # rotation bucket → screen-sized frame
 
         self.font = pygame.font.SysFont(None, 26)
         self.reset()
 
+    def _load(self, path) -> pygame.Surface | None:
+        """Layer scaled to the screen, or None (layer skipped) if the file is missing."""
+        if not pathlib.Path(path).is_file():
+            print(f"Menu layer missing, skipped: {path}")
+            return None
+        return registry.image(path, scale=(self.W, self.H))
+
     # ---------------------------------------------------------
     # external API
     def reset(self):
+        if not self._bg2_frames and self.bg2 is not None:
+            self._build_bg2_frames()
         self.t0 = pygame.time.get_ticks()
         self.alpha2 = 255
         self.alpha3 = 255
@@ -48,49 +68,62 @@ class MenuScene:
         return False
 
     def update(self):
-        now_s = (pygame.time.get_ticks() - self.t0) / 1000
-
-        #start fading after 2 s
-        if now_s > 2 and not self.fade3:
-            self.fade2 = self.fade3 = True
-
-        #alpha step per frame (adjust for speed)
-        step = 5
-        if self.fade2 and self.alpha2 > 0:
-            self.alpha2 = max(0, self.alpha2 - step)
-        if self.fade3 and self.alpha3 > 0:
-            self.alpha3 = max(0, self.alpha3 - step)
-            if self.alpha3 == 0:
-                self.fade4 = True
-        if self.fade4 and self.alpha4 < 255:
-            self.alpha4 = min(255, self.alpha4 + step)
-
-    def draw(self, surf: pygame.Surface, frame_bgr=None):
+        now_s = self._elapsed()
+
+        # start fading after FADE_DELAY, layer 4 fades in once 2 + 3 are gone
+        self.fade2 = self.fade3 = now_s > FADE_DELAY
+        out = min(1.0, max(0.0, (now_s - FADE_DELAY) / FADE_TIME))
+        self.alpha2 = self.alpha3 = round(255 * (1 - out))
+        self.fade4 = out >= 1.0
+        fade_in = min(1.0, max(0.0, (now_s - FADE_DELAY - FADE_TIME) / FADE_TIME))
+        self.alpha4 = round(255 * fade_in)
+        if not self.alpha2 and self._bg2_frames:    # layer 2 is gone until the next reset()
+            self._bg2_frames.clear()
+
+    def draw(self, surf: pygame.Surface, overlay=None):
         # 1 static
-        surf.blit(self.bg1, (0,0))
+        if self.bg1 is not None:
+            surf.blit(self.bg1, (0,0))
 
-        # 2 rotate, fade
-        angle = 5 * math.sin(pygame.time.get_ticks()/3000)
-        rotated = pygame.transform.rotozoom(self.bg2, angle, 1.0)
-        r_rect  = rotated.get_rect(center=(self.W//2, self.H//2))
-        rot_surf = rotated.copy(); rot_surf.set_alpha(self.alpha2)
-        surf.blit(rot_surf, r_rect)
+        # 2 rotate, fade (alpha set on the cached frame itself – no copies)
+        if self.alpha2 and self.bg2 is not None:
+            frame = self._bg2_frame(SWAY_DEG * math.sin(self._elapsed() / SWAY_PERIOD))
+            frame.set_alpha(self.alpha2)
+            surf.blit(frame, (0, 0))
 
         # 3 fade-out
-        layer3 = self.bg3.copy(); layer3.set_alpha(self.alpha3)
-        surf.blit(layer3, (0,0))
+        if self.alpha3 and self.bg3 is not None:
+            self.bg3.set_alpha(self.alpha3)
+            surf.blit(self.bg3, (0,0))
 
         # Draw webcam when Layer 4 is starting
-        if frame_bgr is not None and self.fade4:
-            from helpers import webcam_surface_with_alpha
+        if overlay is not None and self.fade4:
             # Map alpha4 (0-255) into desired webcam transparency
             webcam_alpha = int(self.alpha4 * 0.13)  # 60% maximum transparency
-            cam_surface = webcam_surface_with_alpha(frame_bgr, alpha_val=webcam_alpha)
-            surf.blit(cam_surface, (0, 0))
+            overlay.draw(surf, webcam_alpha)
 
         # 4 fade-in last
-        layer4 = self.bg4.copy(); layer4.set_alpha(self.alpha4)
-        surf.blit(layer4, (0,0))
-
-
+        if self.alpha4 and self.bg4 is not None:
+            self.bg4.set_alpha(self.alpha4)
+            surf.blit(self.bg4, (0,0))
 
+    # ---------------------------------------------------------
+    def _elapsed(self) -> float:
+        return (pygame.time.get_ticks() - self.t0) / 1000
+
+    def _build_bg2_frames(self):
+        """Every layer-2 frame the sway reaches before the layer has faded out (~17 rotozooms)."""
+        visible_ms = int((FADE_DELAY + FADE_TIME) * 1000)
+        for t_ms in range(0, visible_ms + 1):
+            self._bg2_frame(SWAY_DEG * math.sin(t_ms / 1000 / SWAY_PERIOD))
+
+    def _bg2_frame(self, angle: float) -> pygame.Surface:
+        """Layer 2 rotated to the nearest ROTATION_STEP, cropped to the screen (built once per step)."""
+        bucket = round(angle / ROTATION_STEP)
+        frame = self._bg2_frames.get(bucket)
+        if frame is None:
+            rotated = pygame.transform.rotozoom(self.bg2, bucket * ROTATION_STEP, 1.0)
+            crop = pygame.Rect(0, 0, self.W, self.H)
+            crop.center = rotated.get_rect().center
+            frame = self._bg2_frames[bucket] = rotated.subsurface(crop).copy()
+        return frame
@@ -0,0 +1,85 @@
+"""
+Object pools for short-lived sprites (bullets, explosions).
+Instances are built up front and recycled: `acquire()` re-arms a free one
+through its `reset(...)`, and `kill()` hands it back, so heavy waves don't
+churn allocations (and garbage collections) every frame.
+
+Public API
+──────────
+    from pools import SpritePool, Poolable
+    class Bullet(Poolable, LazyMaskSprite):
+        def reset(self, pos, direction): ...        # re-arm a recycled instance
+    pool = SpritePool(Bullet, capacity=64)          # factory() → a blank instance
+    group.add(pool.acquire(pos, direction))         # free instance (hit) or a new one (miss)
+    sprite.kill()                                   # leaves its groups and returns to the pool
+    pool.hits, pool.misses, pool.in_use, pool.peak
+    pool.on_acquire = forget                        # called with each re-armed sprite (e.g. drop stale state)
+"""
+
+from __future__ import annotations
+from typing import Callable
+import pygame
+
+
+class Poolable:
+    """Sprite mixin: `kill()` also releases the sprite to the pool it came from."""
+    pool: SpritePool | None = None
+    _pooled = False                     # True while sitting in the pool's free list
+
+    def kill(self):
+        super().kill()
+        if self.pool is not None:
+            self.pool.release(self)
+
+
+class SpritePool:
+    def __init__(self, factory: Callable[[], pygame.sprite.Sprite], capacity: int, name: str | None = None,
+                 on_acquire: Callable[[pygame.sprite.Sprite], object] | None = None):
+        self.factory = factory
+        self.on_acquire = on_acquire
+        self.capacity = capacity                    # instances kept; extra releases are dropped
+        self.name = name or getattr(factory, "__name__", "pool").lower()
+        self._free = [self._make() for _ in range(capacity)]
+        self.reset_stats()
+
+    def _make(self) -> pygame.sprite.Sprite:
+        sprite = self.factory()
+        sprite.pool = self
+        sprite._pooled = True
+        return sprite
+
+    def acquire(self, *args, **kwargs) -> pygame.sprite.Sprite:
+        if self._free:
+            sprite = self._free.pop()
+            self.hits += 1
+        else:
+            sprite = self._make()
+            self.misses += 1
+        sprite._pooled = False
+        sprite.reset(*args, **kwargs)
+        if self.on_acquire is not None:
+            self.on_acquire(sprite)
+        self.in_use += 1
+        self.peak = max(self.peak, self.in_use)
+        return sprite
+
+    def release(self, sprite: pygame.sprite.Sprite):
+        if sprite._pooled:                          # already back (e.g. killed twice)
+            return
+        sprite._pooled = True
+        self.in_use -= 1
+        if len(self._free) < self.capacity:
+            self._free.append(sprite)
+
+    # ---------------------------------------------------------
+    def reset_stats(self):
+        self.hits = self.misses = 0
+        self.peak = self.in_use = getattr(self, "in_use", 0)
+
+    @property
+    def hit_rate(self) -> float:
+        n = self.hits + self.misses
+        return self.hits / n if n else 1.0
+
+    def __str__(self):
+        return f"{self.name} {self.hit_rate:.0%} hit ({self.misses} miss, {self.in_use} live)"
@@ -0,0 +1,264 @@
+"""
+Frame-stage timing, cheap enough to leave on.
+
+    timer = StageTimer(capacity=600)      # last 600 frames, kept in ring buffers
+    with timer.section("update"):
+        ...
+    timer.record("blur", ms)              # time measured elsewhere (e.g. the capture thread)
+    timer.end_frame()                     # closes the frame, records its total time
+    timer.frames / timer.samples          # ms arrays, oldest → newest
+    timer.export("profile.csv")           # or .json
+
+    overlay = ProfilerOverlay(timer)      # stacked per-stage graph
+    overlay.draw(screen, (x, y))          # → Rect drawn
+    cprof = CProfileToggle()
+    cprof.toggle()                        # start … toggle() again writes profile-<time>.prof
+
+`NULL_TIMER` has the same timing API and does nothing.
+"""
+
+from __future__ import annotations
+import cProfile, csv, json, time
+import numpy as np
+import pygame
+
+from hud import text_cache
+
+DEFAULT_CAPACITY = 600               # frames kept (10 s at 60 fps)
+BACKGROUND_STAGES = ("blur", "blur_detect")   # measured off the main thread – not part of the frame time
+
+
+class RingBuffer:
+    """Fixed-size float ring: O(1) append, no allocation."""
+    __slots__ = ("data", "i", "n")
+
+    def __init__(self, capacity: int):
+        self.data = np.zeros(capacity, np.float64)
+        self.i = self.n = 0
+
+    def append(self, x: float):
+        self.data[self.i] = x
+        self.i = (self.i + 1) % len(self.data)
+        if self.n < len(self.data):
+            self.n += 1
+
+    def values(self) -> np.ndarray:
+        """Copy of the stored samples, oldest first."""
+        if self.n < len(self.data):
+            return self.data[:self.n].copy()
+        return np.concatenate([self.data[self.i:], self.data[:self.i]])
+
+    def last(self) -> float:
+        return float(self.data[self.i - 1]) if self.n else 0.0
+
+    def __len__(self):
+        return self.n
+
+
+class _Section:
+    """Reusable context manager for one stage name (no generator per `with`)."""
+    __slots__ = ("current", "name", "t0")
+
+    def __init__(self, current: dict, name: str):
+        self.current, self.name, self.t0 = current, name, 0.0
+
+    def __enter__(self):
+        self.t0 = time.perf_counter()
+
+    def __exit__(self, *exc):
+        self.current[self.name] = self.current.get(self.name, 0.0) + (time.perf_counter() - self.t0) * 1000
+
+
+class StageTimer:
+    def __init__(self, capacity: int = DEFAULT_CAPACITY):
+        self.capacity = capacity
+        self.reset()
+
+    def reset(self):
+        """Forget all samples (e.g. after a warm-up)."""
+        self.stages: list[str] = []                     # in order of first appearance
+        self._rings: dict[str, RingBuffer] = {}         # stage → ms per frame
+        self._frames = RingBuffer(self.capacity)        # whole-frame ms
+        self._current: dict[str, float] = {}
+        self._sections: dict[str, _Section] = {}
+        self.count = 0                                  # frames ended since reset()
+        self._frame_start = time.perf_counter()
+
+    # ---------------------------------------------------------
+    # recording
+    def section(self, name: str) -> _Section:
+        s = self._sections.get(name)
+        if s is None:
+            s = self._sections[name] = _Section(self._current, name)
+        return s
+
+    def record(self, name: str, ms: float):
+        self._current[name] = self._current.get(name, 0.0) + ms
+
+    def end_frame(self):
+        now = time.perf_counter()
+        self._frames.append((now - self._frame_start) * 1000)
+        current = self._current
+        for name in current:
+            if name not in self._rings:
+                ring = self._rings[name] = RingBuffer(self.capacity)
+                ring.i, ring.n = self._frames.i - 1, self._frames.n - 1   # aligned with frames
+                ring.i %= self.capacity
+                self.stages.append(name)
+        for name, ring in self._rings.items():
+            ring.append(current.get(name, 0.0))
+        current.clear()
+        self.count += 1
+        self._frame_start = now
+
+    def restart_frame(self):
+        """Start the next frame's clock now (e.g. after sleeping in clock.tick)."""
+        self._current.clear()
+        self._frame_start = time.perf_counter()
+
+    # ---------------------------------------------------------
+    # reading
+    @property
+    def frames(self) -> np.ndarray:
+        return self._frames.values()
+
+    @property
+    def samples(self) -> dict[str, np.ndarray]:
+        return {name: self._rings[name].values() for name in self.stages}
+
+    def last(self, name: str) -> float:
+        ring = self._rings.get(name)
+        return ring.last() if ring is not None else 0.0
+
+    def export(self, path) -> str:
+        """Write every buffered frame to *path* (.json, anything else → CSV)."""
+        path = str(path)
+        frames, samples = self.frames, self.samples
+        if path.endswith(".json"):
+            with open(path, "w") as f:
+                json.dump({"frame_ms": frames.tolist(),
+                           "stages_ms": {k: v.tolist() for k, v in samples.items()}}, f)
+        else:
+            with open(path, "w", newline="") as f:
+                w = csv.writer(f)
+                w.writerow(["frame_ms", *self.stages])
+                for row in zip(frames, *samples.values()):
+                    w.writerow([f"{v:.3f}" for v in row])
+        return path
+
+
+class _NullTimer:
+    _null = _Section({}, "")
+
+    def section(self, name: str):
+        return self._null
+
+    def record(self, name: str, ms: float):
+        pass
+
+    def end_frame(self):
+        pass
+
+    def restart_frame(self):
+        pass
+
+
+NULL_TIMER = _NullTimer()
+
+
+# ────────────────────────────────
+# On-screen graph
+# ────────────────────────────────
+PALETTE = [(80, 200, 255), (255, 170, 60), (120, 230, 120), (230, 90, 200),
+           (255, 230, 80), (160, 140, 255), (255, 100, 100), (200, 200, 200)]
+GRAPH_MS = 33.3          # top of the graph
+BUDGET_MS = 1000 / 60    # reference line
+LEGEND_EVERY = 30        # frames between legend refreshes
+
+
+class ProfilerOverlay:
+    """
+    Scrolling stacked-bar graph, one column per frame. The graph surface is
+    scrolled and only the newest column is drawn, so it costs a few blits.
+    """
+
+    def __init__(self, timer: StageTimer, size: tuple[int, int] = (300, 100)):
+        self.timer = timer
+        self.w, self.h = size
+        self.graph = pygame.Surface(size, pygame.SRCALPHA)
+        self.graph.fill((0, 0, 0, 150))
+        self._seen = 0
+        self._legend: list[pygame.Surface] = []
+
+    def _y(self, ms: float) -> int:
+        return self.h - min(self.h, round(ms / GRAPH_MS * self.h))
+
+    def _add_column(self):
+        g, t = self.graph, self.timer
+        g.scroll(-1, 0)
+        x = self.w - 1
+        pygame.draw.line(g, (0, 0, 0, 150), (x, 0), (x, self.h))
+        total = 0.0
+        for k, name in enumerate(t.stages):
+            if name in BACKGROUND_STAGES:
+                continue
+            ms = t.last(name)
+            y0, y1 = self._y(total), self._y(total + ms)
+            if y0 > y1:
+                pygame.draw.line(g, PALETTE[k % len(PALETTE)], (x, y1), (x, y0 - 1))
+            total += ms
+        y = self._y(t._frames.last())
+        g.set_at((x, y if y < self.h else self.h - 1), (255, 255, 255))
+        g.set_at((x, self._y(BUDGET_MS)), (255, 60, 60))
+
+    def _refresh_legend(self):
+        t = self.timer
+        frames = t.frames
+        lines = [("frame", (255, 255, 255), frames)] + \
+                [(n, PALETTE[k % len(PALETTE)], t._rings[n].values()) for k, n in enumerate(t.stages)]
+        self._legend = []
+        for name, color, ms in lines:
+            if not len(ms):
+                continue
+            p50, p95 = np.percentile(ms, [50, 95])
+            self._legend.append(text_cache.render(f"{name:<8} {p50:5.1f} / {p95:5.1f} ms", 18, color))
+
+    def draw(self, screen: pygame.Surface, pos: tuple[int, int]) -> pygame.Rect:
+        t = self.timer
+        if t.count != self._seen:
+            if t.count < self._seen or not self._legend or t.count // LEGEND_EVERY != self._seen // LEGEND_EVERY:
+                self._refresh_legend()
+            self._add_column()
+            self._seen = t.count
+        x, y = pos
+        rect = screen.blit(self.graph, pos)
+        for i, surf in enumerate(self._legend):
+            rect.union_ip(screen.blit(surf, (x, y + self.h + 2 + 14 * i)))
+        return rect
+
+
+# ────────────────────────────────
+# cProfile on demand
+# ────────────────────────────────
+class CProfileToggle:
+    def __init__(self, prefix: str = "profile"):
+        self.prefix = prefix
+        self._prof: cProfile.Profile | None = None
+
+    @property
+    def running(self) -> bool:
+        return self._prof is not None
+
+    def toggle(self) -> str | None:
+        """Start profiling, or stop and dump; returns the .prof path when a dump was written."""
+        if self._prof is None:
+            self._prof = cProfile.Profile()
+            self._prof.enable()
+            print("cProfile: recording…")
+            return None
+        self._prof.disable()
+        path = f"{self.prefix}-{time.strftime('%Y%m%d-%H%M%S')}.prof"
+        self._prof.dump_stats(path)
+        self._prof = None
+        print(f"cProfile: wrote {path}")
+        return path
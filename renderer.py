@@ -0,0 +1,106 @@
+"""
+Frame rendering with a cached parallax background and optional dirty rects.
+
+The parallax layers are composited into one opaque, display-format surface
+per (quantised) ship position, so a frame costs one full-screen blit
+instead of three alpha blits. With `dirty=True`, frames that don't need a
+full redraw only restore and update the regions drawn last frame and this
+frame; a full redraw happens whenever the background moves or the caller
+asks for one (webcam overlay, menu, debug drawing).
+
+Public API
+──────────
+    renderer = Renderer(screen, [(bg0, .02), (bg1, .06), (bg2, .10)], dirty=True)
+    renderer.begin(ship_center, full=False)    # background (all of it, or only stale regions)
+    renderer.mark(screen.blit(img, pos))       # record what was drawn (Rect or list of Rects)
+    renderer.present()                         # display.flip() or display.update(rects)
+"""
+
+from __future__ import annotations
+from collections import OrderedDict
+import pygame
+from pygame import Vector2
+
+from helpers import parallax_offset
+
+BG_QUANTUM = 8           # px of ship movement per cached background (≤ 1 px of parallax shift)
+MAX_COMPOSITES = 16      # cached background composites (one screen-sized surface each)
+
+
+class BackgroundCache:
+    """Parallax layers composited once per quantised ship position (LRU)."""
+
+    def __init__(self, layers: list[tuple[pygame.Surface, float]], screen_size: tuple[int, int],
+                 quantum: int = BG_QUANTUM, max_entries: int = MAX_COMPOSITES):
+        base, base_factor = layers[0]
+        self.layers = [(base.convert(), base_factor)] + list(layers[1:])   # base layer is opaque
+        self.size = screen_size
+        self.quantum = quantum
+        self.max_entries = max_entries
+        self._composites: OrderedDict[tuple, pygame.Surface] = OrderedDict()
+        self.hits = self.misses = 0
+
+    def offsets(self, ship_center) -> tuple[tuple[int, int], ...]:
+        q = self.quantum
+        snapped = Vector2(round(ship_center[0] / q) * q, round(ship_center[1] / q) * q)
+        w, h = self.size
+        return tuple(parallax_offset(snapped, f, img.get_size(), w, h) for img, f in self.layers)
+
+    def get(self, ship_center) -> pygame.Surface:
+        key = self.offsets(ship_center)
+        surf = self._composites.get(key)
+        if surf is not None:
+            self.hits += 1
+            self._composites.move_to_end(key)
+            return surf
+        self.misses += 1
+        surf = pygame.Surface(self.size).convert()
+        for (img, _), pos in zip(self.layers, key):
+            surf.blit(img, pos)
+        self._composites[key] = surf
+        if len(self._composites) > self.max_entries:
+            self._composites.popitem(last=False)
+        return surf
+
+
+class Renderer:
+    def __init__(self, screen: pygame.Surface, layers: list[tuple[pygame.Surface, float]],
+                 dirty: bool = False, quantum: int = BG_QUANTUM):
+        self.screen = screen
+        self.backgrounds = BackgroundCache(layers, screen.get_size(), quantum)
+        self.dirty = dirty
+        self.full = True                   # whether the current frame is a full redraw
+        self._forced = True                # last frame was forced full: unmarked drawing may be on screen
+        self._bg: pygame.Surface | None = None
+        self._prev: list[pygame.Rect] = []
+        self._cur: list[pygame.Rect] = []
+        self.full_frames = self.dirty_frames = 0
+
+    def begin(self, ship_center, full: bool = False) -> pygame.Surface:
+        """Lay down the background for a new frame; returns the composite used."""
+        bg = self.backgrounds.get(ship_center)
+        self.full = full or self._forced or not self.dirty or bg is not self._bg
+        self._forced = full
+        self._bg = bg
+        if self.full:
+            self.screen.blit(bg, (0, 0))
+        else:
+            self.screen.blits([(bg, r, r) for r in self._prev], doreturn=False)
+        self._cur = []
+        return bg
+
+    def mark(self, rects):
+        """Record a Rect (or iterable of Rects) drawn this frame."""
+        if isinstance(rects, pygame.Rect):
+            self._cur.append(rects)
+        else:
+            self._cur.extend(rects)
+
+    def present(self):
+        if self.full:
+            pygame.display.flip()
+            self.full_frames += 1
+        else:
+            pygame.display.update(self._prev + self._cur)
+            self.dirty_frames += 1
+        self._prev = self._cur
@@ -0,0 +1,85 @@
+"""
+Shared cache of pre-rotated sprite images.
+Angles are snapped to `step` degrees, so a spinning sprite only ever needs
+360 / step different images; each one is rotated exactly once, and its
+collision mask is built the first time a collision check asks for it.
+
+Public API
+──────────
+    from rotation_cache import rotations
+    image = rotations.get(src_surface, angle)                 # rotated copy
+    mask  = rotations.mask(image)                             # lazy; None if *image* isn't cached
+    rotations.configure(step=5, max_bytes=32 * 2**20)         # drops the cache
+"""
+
+from __future__ import annotations
+from collections import OrderedDict
+import pygame
+
+from collision import mask_stats
+
+DEFAULT_STEP = 3.0                 # degrees per cached angle
+DEFAULT_MAX_BYTES = 64 * 2**20     # rough pixel-memory budget (LRU beyond that)
+
+
+class RotationCache:
+    def __init__(self, step: float = DEFAULT_STEP, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.step = step
+        self.max_bytes = max_bytes
+        # (source surface, angle bucket) → [rotated surface, mask | None, bytes]
+        self._entries: OrderedDict[tuple[pygame.Surface, int], list] = OrderedDict()
+        self._by_image: dict[pygame.Surface, list] = {}      # rotated surface → its entry
+        self.bytes = 0
+        self.hits = self.misses = 0
+
+    # ---------------------------------------------------------
+    def configure(self, step: float | None = None, max_bytes: int | None = None):
+        if step is not None:
+            self.step = step
+        if max_bytes is not None:
+            self.max_bytes = max_bytes
+        self.clear()
+
+    def clear(self):
+        self._entries.clear()
+        self._by_image.clear()
+        self.bytes = 0
+
+    def bucket(self, angle: float) -> int:
+        """Index of the cached angle nearest to *angle*."""
+        return round((angle % 360) / self.step) % round(360 / self.step)
+
+    def get(self, src: pygame.Surface, angle: float) -> pygame.Surface:
+        """Rotated copy of *src* at (quantised) *angle*."""
+        key = (src, self.bucket(angle))
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            image = pygame.transform.rotate(src, key[1] * self.step)
+            size = image.get_width() * image.get_height() * image.get_bytesize()
+            entry = self._entries[key] = [image, None, size]
+            self._by_image[image] = entry
+            self.bytes += size
+            self._evict()
+        else:
+            self.hits += 1
+            self._entries.move_to_end(key)
+        return entry[0]
+
+    def mask(self, image: pygame.Surface) -> pygame.mask.Mask | None:
+        """Collision mask of a surface returned by get(), built on first request."""
+        entry = self._by_image.get(image)
+        if entry is None:
+            return None
+        if entry[1] is None:
+            entry[1] = mask_stats.build(image)
+        return entry[1]
+
+    def _evict(self):
+        while self.bytes > self.max_bytes and len(self._entries) > 1:
+            _, (image, _, size) = self._entries.popitem(last=False)
+            del self._by_image[image]
+            self.bytes -= size
+
+
+rotations = RotationCache()
@@ -0,0 +1,38 @@
+"""
+Simulation clock for the fixed-timestep loop.
+Game advances it by exactly one tick per simulation step, so everything
+timed against it (cool-downs, invincibility, animations, wave timers)
+runs at the same speed whatever the render or detection rate.
+
+Public API
+──────────
+    from sim_clock import sim_clock, SIM_HZ
+    sim_clock.ms          # simulated milliseconds since reset()
+    sim_clock.dt          # seconds per tick (1 / SIM_HZ)
+    sim_clock.advance()   # one tick – only the game loop calls this
+"""
+
+from __future__ import annotations
+
+SIM_HZ = 60              # simulation ticks per second (motion speeds are px / tick)
+
+
+class SimClock:
+    def __init__(self, hz: int = SIM_HZ):
+        self.hz = hz
+        self.dt = 1 / hz
+        self.dt_ms = 1000 / hz
+        self.reset()
+
+    def reset(self):
+        self.ticks = 0
+
+    @property
+    def ms(self) -> float:
+        return self.ticks * self.dt_ms
+
+    def advance(self):
+        self.ticks += 1
+
+
+sim_clock = SimClock()
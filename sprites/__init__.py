@@ -1,6 +1,6 @@
+from .lazy_mask import LazyMaskSprite
 from .bullet import Bullet
-from .asteroid import Asteroid
 from .spaceship import Spaceship
-from .explosion import Explosion  # ← add this
+from .explosion import Explosion, ExplosionFrames
 
-__all__ = ["Bullet", "Asteroid", "Spaceship", "Explosion"]
+__all__ = ["LazyMaskSprite", "Bullet", "Spaceship", "Explosion", "ExplosionFrames"]
@@ -24,35 +24,36 @@
 # Bullet sprite: rotating "package" projectile
 from __future__ import annotations
 import os, pygame
+from asset_registry import registry
 from pygame import Vector2
+from pools import Poolable
+from rotation_cache import rotations
+from .lazy_mask import LazyMaskSprite
 
-class Bullet(pygame.sprite.Sprite):
-    """A parcel‑shaped bullet that slowly spins while travelling."""
-
-    SPEED = 14       # pixels per frame
-    ROT_SPEED = 6    # degrees per frame
-    _original_img: pygame.Surface | None = None
+class Bullet(Poolable, LazyMaskSprite):
+    """A parcel‑shaped bullet that slowly spins while travelling (pooled: see `reset`)."""
 
+    SPEED = 14       # pixels per tick
+    ROT_SPEED = 6    # degrees per tick
     # ––––––––––––––––––––––––––––––––––––––––––––––––––––––––
     @classmethod
     def _load_image(cls) -> pygame.Surface:
-        """Load and cache the package sprite (scaled once for all bullets)."""
-        if cls._original_img is None:
-            path = os.path.join("assets/effects", "package.png")        # <- put your sprite here
-            img = pygame.image.load(path).convert_alpha()
-            cls._original_img = pygame.transform.smoothscale(img, (24, 24))
-        return cls._original_img
+        """Package sprite from the asset registry (scaled once for all bullets)."""
+        path = os.path.join("assets/effects", "Package.png")        # <- put your sprite here
+        return registry.image(path, scale=(24, 24), smooth=True)
 
     # ––––––––––––––––––––––––––––––––––––––––––––––––––––––––
-    def __init__(self, pos: Vector2, direction: Vector2):
+    def __init__(self, pos: Vector2 = Vector2(0, 0), direction: Vector2 = Vector2(0, -1)):
         super().__init__()
         self.base_image = self._load_image()
-        self.image = self.base_image
+        self.reset(pos, direction)
+
+    def reset(self, pos: Vector2, direction: Vector2):
+        """(Re-)launch from *pos* – also used when the bullet comes out of a pool."""
+        self.image = rotations.get(self.base_image, 0)
         self.rect = self.image.get_rect(center=pos)
         self.angle = 0
 
-        self.mask = pygame.mask.from_surface(self.image)
-
         # Velocity
         self.vel = (direction.normalize() * self.SPEED
                     if direction.length_squared() > 0.1 else Vector2(0, -self.SPEED))
@@ -64,12 +65,10 @@ class Bullet(pygame.sprite.Sprite):
 
         # Rotate sprite around its centre
         self.angle = (self.angle + self.ROT_SPEED) % 360
-        self.image = pygame.transform.rotate(self.base_image, self.angle)
+        # (cached image; its mask is only built if a collision check needs it)
+        self.image = rotations.get(self.base_image, self.angle)
         self.rect = self.image.get_rect(center=self.rect.center)
 
-        # Update mask for pixel‑perfect collision
-        self.mask = pygame.mask.from_surface(self.image)
-
         # Auto‑despawn when off‑screen
         if not pygame.display.get_surface().get_rect().colliderect(self.rect):
             self.kill()
@@ -77,8 +76,7 @@ class Bullet(pygame.sprite.Sprite):
     def draw_debug(self, surface):
         """Draw the bullet's bounding box and mask."""
         pygame.draw.rect(surface, (255, 0, 0), self.rect, 1)  # Bounding box
-        if hasattr(self, 'mask') and self.mask:
-            from pygame import Surface
+        if self.mask:
             debug_mask = self.mask.to_surface(setcolor=(0, 255, 0, 100), unsetcolor=(0, 0, 0, 0))
             surface.blit(debug_mask, self.rect.topleft)
 
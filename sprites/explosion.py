@@ -1,39 +1,88 @@
 """
 Explosion sprite: appears when an asteroid is destroyed.
 It keeps moving with the asteroid's last velocity and disappears after a short time.
+
+The animation (scale × rotation × fade) is pre-rendered by ExplosionFrames
+once per (size bucket, spin bucket), the first time that bucket explodes
+(a few ms); a live explosion only picks the frame for its elapsed time, so
+a burst of hits costs blits, not transforms.
 """
 
+from __future__ import annotations
 import pygame
+from pools import Poolable
+from sim_clock import sim_clock
+
+DURATION = 300          # milliseconds (simulation time) to stay visible
+FRAMES = 12             # pre-rendered frames per sequence (one per 25 ms)
+SIZE_BUCKET = 20        # px – explosion sizes are snapped to multiples of this
+SPIN_BUCKET = 1.0       # degrees / tick – spins are snapped to multiples of this
+
+
+class ExplosionFrames:
+    """Lazily built, shared frame sequences keyed by (size bucket, spin bucket)."""
+
+    def __init__(self, base: pygame.Surface):
+        self.base = base
+        self._seqs: dict[tuple[int, int], list[pygame.Surface]] = {}
+
+    @staticmethod
+    def key(size: float, spin: float) -> tuple[int, int]:
+        return max(1, round(size / SIZE_BUCKET)), round(spin / SPIN_BUCKET)
+
+    def get(self, size: float, spin: float) -> list[pygame.Surface]:
+        k = self.key(size, spin)
+        seq = self._seqs.get(k)
+        if seq is None:
+            seq = self._seqs[k] = self._render(*k)
+        return seq
 
-class Explosion(pygame.sprite.Sprite):
-    DURATION = 300  # milliseconds to stay visible
+    def warm(self, sizes, spins):
+        """Pre-render every combination now (e.g. off the critical path) instead of on first use."""
+        for size in sizes:
+            for spin in spins:
+                self.get(size, spin)
 
-    def __init__(self, pos, image: pygame.Surface, velocity: pygame.Vector2, rotation_speed: float):
+    def _render(self, size_b: int, spin_b: int) -> list[pygame.Surface]:
+        side = size_b * SIZE_BUCKET
+        img = pygame.transform.smoothscale(self.base, (side, side))
+        ticks_per_frame = DURATION / FRAMES / sim_clock.dt_ms
+        seq = []
+        for f in range(FRAMES):
+            frame = pygame.transform.rotate(img, spin_b * SPIN_BUCKET * ticks_per_frame * f)
+            alpha = round(255 * (1 - f / FRAMES))                    # from 255 → 0, baked in
+            frame.fill((255, 255, 255, alpha), special_flags=pygame.BLEND_RGBA_MULT)
+            seq.append(frame)
+        return seq
+
+    def __len__(self):
+        return len(self._seqs)
+
+
+class Explosion(Poolable, pygame.sprite.Sprite):
+    DURATION = DURATION
+
+    def __init__(self, pos, frames: list[pygame.Surface], velocity: pygame.Vector2):
         super().__init__()
-        self.original_image = image
-        self.image = image.copy()
+        self.reset(pos, frames, velocity)
+
+    def reset(self, pos, frames: list[pygame.Surface], velocity: pygame.Vector2):
+        """(Re-)start the effect – also used when the explosion comes out of a pool."""
+        self.frames = frames
+        self.image = frames[0]
         self.rect = self.image.get_rect(center=pos)
         self.velocity = velocity
-        self.spawn_time = pygame.time.get_ticks()
-        self.angle = 0
-        self.rotation_speed = rotation_speed
+        self.spawn_time = sim_clock.ms
 
     def update(self):
-        now = pygame.time.get_ticks()
-        elapsed = now - self.spawn_time
-
         # Move the explosion in the same direction
         self.rect.centerx += int(self.velocity.x)
         self.rect.centery += int(self.velocity.y)
 
-        # Rotate
-        self.angle = (self.angle + self.rotation_speed) % 360
-        self.image = pygame.transform.rotate(self.original_image, self.angle)
+        # Pick the pre-rendered frame for the elapsed time
+        f = int((sim_clock.ms - self.spawn_time) * len(self.frames) / self.DURATION)
+        if f >= len(self.frames):
+            self.kill()
+            return
+        self.image = self.frames[f]
         self.rect = self.image.get_rect(center=self.rect.center)
-
-        # Fade out
-        if elapsed < self.DURATION:
-            alpha = 255 * (1 - elapsed / self.DURATION)  # from 255 → 0
-            self.image.set_alpha(int(alpha))
-        else:
-            self.kill()
\ No newline at end of file
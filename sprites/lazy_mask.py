@@ -0,0 +1,39 @@
+"""
+Sprite base with a lazily built collision mask.
+`mask` is computed from `image` the first time something reads it (the
+narrow phase of a collision check, or debug drawing) and dropped when a
+*different* surface is assigned to `image`. Rotated images from the
+rotation cache share one mask per cached angle.
+"""
+
+from __future__ import annotations
+import pygame
+from collision import mask_stats
+from rotation_cache import rotations
+
+
+class LazyMaskSprite(pygame.sprite.Sprite):
+    _image: pygame.Surface | None = None
+    _mask: pygame.mask.Mask | None = None
+
+    @property
+    def image(self) -> pygame.Surface:
+        return self._image
+
+    @image.setter
+    def image(self, surface: pygame.Surface):
+        if surface is not self._image:
+            self._image = surface
+            self._mask = None
+
+    @property
+    def mask(self) -> pygame.mask.Mask:
+        if self._mask is None:
+            self._mask = rotations.mask(self._image)
+            if self._mask is None:                      # not a cached rotation
+                self._mask = mask_stats.build(self._image)
+        return self._mask
+
+    @mask.setter
+    def mask(self, mask: pygame.mask.Mask):
+        self._mask = mask
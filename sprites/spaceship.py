@@ -3,35 +3,37 @@ Player ship: moves with left hand; fires when right hand is open.
 """
 
 from __future__ import annotations
-import pygame, mediapipe as mp
+import pygame
 from pygame import Vector2
 from .bullet import Bullet
-from tracking import hand_is_open, center_px   # re-use helpers
-
-mp_hands = mp.solutions.hands
-
-class Spaceship(pygame.sprite.Sprite):
-    BULLET_COOLDOWN = 500        # ms
+from rotation_cache import rotations
+from .lazy_mask import LazyMaskSprite
+from tracking import hand_is_open, center_px, to_screen, FULL_VIEW   # re-use helpers
+from hand_state import HandState, INDEX_TIP
+from sim_clock import sim_clock
+
+class Spaceship(LazyMaskSprite):
+    BULLET_COOLDOWN = 500        # ms (simulation time)
     INVINCIBLE_MS  = 1000
     ANIM_SPEED     = 100         # ms per frame
 
 
-    def __init__(self, pos, images, bullet_group: pygame.sprite.Group):
+    def __init__(self, pos, images, bullet_group: pygame.sprite.Group, bullet_pool=None):
         super().__init__()
         self.images = images
         self.image_index = 0
-        self.image = self.images[0]
-        self.mask = pygame.mask.from_surface(self.image)
+        self.image = rotations.get(self.images[0], 0)
         self.rect = self.image.get_rect(center=pos)
         self._last_angle = 0  # store last rotation
         self._current_angle = 0  # For smooth interpolation
         self.ROTATE_SMOOTHNESS = 0.15  # Adjust this from 0.05 (slow) to 0.3 (fast)
 
         self.bullets = bullet_group
+        self.bullet_pool = bullet_pool     # SpritePool of Bullets (None → a new Bullet per shot)
         self.health  = 5
         self.score   = 0
 
-        self._last_shot   = 0
+        self._last_shot   = -self.BULLET_COOLDOWN
         self._invincible_until = 0
         self._last_anim   = 0
         self._last_pos    = Vector2(self.rect.center)  # for rotation hint
@@ -41,7 +43,7 @@ class Spaceship(pygame.sprite.Sprite):
     # ────────────────────────────────
     @property
     def invincible(self) -> bool:
-        return pygame.time.get_ticks() < self._invincible_until
+        return sim_clock.ms < self._invincible_until
 
     # ────────────────────────────────
     # Event handlers
@@ -49,28 +51,29 @@ class Spaceship(pygame.sprite.Sprite):
     def hit(self):
         if not self.invincible:
             self.health -= 1
-            self._invincible_until = pygame.time.get_ticks() + self.INVINCIBLE_MS
+            self._invincible_until = sim_clock.ms + self.INVINCIBLE_MS
 
-    def move(self, left_hand_lms, w, h):
-        if left_hand_lms:
+    def move(self, left_hand: HandState | None, w, h, view=FULL_VIEW):
+        if left_hand:
             self._last_pos = Vector2(self.rect.center)
-            self.rect.center = center_px(left_hand_lms, w, h)
+            self.rect.center = center_px(left_hand, w, h, view)
 
-    def shoot(self, right_hand_lms, w, h):
-        now = pygame.time.get_ticks()
-        if (right_hand_lms and hand_is_open(right_hand_lms) and
+    def shoot(self, right_hand: HandState | None, w, h, view=FULL_VIEW):
+        now = sim_clock.ms
+        if (right_hand and hand_is_open(right_hand) and
                 now - self._last_shot >= self.BULLET_COOLDOWN):
 
-            tip = right_hand_lms.landmark[mp_hands.HandLandmark.INDEX_FINGER_TIP]
-            direction = Vector2(tip.x * w, tip.y * h) - Vector2(self.rect.center)
+            direction = to_screen(*right_hand.point(INDEX_TIP), w, h, view) - Vector2(self.rect.center)
             if direction.length_squared() > 1:
-                self.bullets.add(Bullet(Vector2(self.rect.center), direction))
+                pos = Vector2(self.rect.center)
+                self.bullets.add(self.bullet_pool.acquire(pos, direction) if self.bullet_pool is not None
+                                 else Bullet(pos, direction))
                 self._last_shot = now
 
 
     def update(self):
         self.rect.clamp_ip(pygame.display.get_surface().get_rect())
-        now = pygame.time.get_ticks()
+        now = sim_clock.ms
 
         # Animation
         if now - self._last_anim >= self.ANIM_SPEED:
@@ -94,11 +97,10 @@ class Spaceship(pygame.sprite.Sprite):
         self._last_angle = target_angle
 
         # Rotate image
-        self.image = pygame.transform.rotate(current_frame, self._current_angle)
+        self.image = rotations.get(current_frame, self._current_angle)
         self.rect = self.image.get_rect(center=self.rect.center)
-        self.mask = pygame.mask.from_surface(self.image)
 
-        # Flash if invincible
+        # Flash if invincible (cached image is only shared with this ship, so alpha is reset every frame)
         if self.invincible and (now // 100) % 2:
             self.image.set_alpha(80)
         else:
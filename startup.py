@@ -0,0 +1,138 @@
+"""
+Staged start-up: the window and menu come up first, the slow parts
+(MediaPipe import + model, camera open, detection worker) load on a
+background thread while the menu is already rendering.
+
+Public API
+──────────
+    from startup import startup_log, BackgroundLoader, DeferredInput
+    startup_log.mark("window")                     # "[startup] window  +412 ms"
+    loader = BackgroundLoader([("open camera", open_camera), …]).start()
+    hand_input = DeferredInput(loader)             # Game input; real input once loaded
+    loader.progress, loader.status, loader.done    # for the menu's progress bar
+"""
+
+from __future__ import annotations
+import threading, time, traceback
+
+
+class StartupLog:
+    """Prints time since start-up for each milestone (and keeps them)."""
+
+    def __init__(self):
+        self.t0 = time.perf_counter()
+        self.marks: dict[str, float] = {}       # name → ms since t0
+
+    def mark(self, name: str, phase_ms: float | None = None):
+        ms = (time.perf_counter() - self.t0) * 1000
+        self.marks[name] = ms
+        extra = f"   ({phase_ms:.0f} ms)" if phase_ms is not None else ""
+        print(f"[startup] {name:<24} +{ms:6.0f} ms{extra}")
+
+
+startup_log = StartupLog()
+
+
+class BackgroundLoader:
+    """
+    Runs named phases in order on a daemon thread. Each phase gets the
+    shared `context` dict; the last phase's return value is `result`.
+    """
+
+    def __init__(self, phases: list[tuple[str, callable]], log: StartupLog = startup_log):
+        self.phases = phases
+        self.log = log
+        self.context: dict = {}
+        self.timings: dict[str, float] = {}      # phase → ms
+        self.result = None
+        self.error: BaseException | None = None
+        self.status = "waiting"
+        self._completed = 0
+        self._done = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="startup-loader", daemon=True)
+
+    @property
+    def progress(self) -> float:
+        return self._completed / len(self.phases) if self.phases else 1.0
+
+    @property
+    def done(self) -> bool:
+        return self._done.is_set()
+
+    def start(self) -> BackgroundLoader:
+        self._thread.start()
+        return self
+
+    def wait(self, timeout: float | None = None) -> bool:
+        return self._done.wait(timeout)
+
+    def release(self):
+        """Stop whatever the phases left in `context` (newest first) – for a failed or unfinished load."""
+        for obj in reversed(list(self.context.values())):
+            for name in ("stop", "close", "release"):
+                fn = getattr(obj, name, None)
+                if callable(fn):
+                    try:
+                        fn()
+                    except Exception as e:
+                        print(f"[startup] {type(obj).__name__}.{name}() failed: {e}")
+                    break
+
+    def _run(self):
+        try:
+            for name, fn in self.phases:
+                self.status = name
+                t0 = time.perf_counter()
+                self.result = fn(self.context)
+                self.timings[name] = (time.perf_counter() - t0) * 1000
+                self._completed += 1
+                self.log.mark(name, self.timings[name])
+            self.status = "ready"
+        except Exception as e:                       # shown on the menu, game stays usable (no hands)
+            self.error = e
+            self.status = f"failed: {self.status} ({e})"
+            traceback.print_exc()
+        finally:
+            self._done.set()
+
+
+CLOSE_TIMEOUT = 2.0      # s DeferredInput.close() waits for a phase still in progress
+
+
+class DeferredInput:
+    """Game input that behaves like "no camera, no hands" until the loader's result is ready."""
+
+    def __init__(self, loader: BackgroundLoader):
+        self.loader = loader
+        self.inner = None
+
+    def _ready(self):
+        if self.inner is None and self.loader.done and self.loader.error is None:
+            self.inner = self.loader.result
+        return self.inner
+
+    @property
+    def hands_ts(self) -> float:
+        inner = self._ready()
+        return inner.hands_ts if inner is not None else 0.0
+
+    def __getattr__(self, name):                 # e.g. .capture for the debug line, once loaded
+        inner = self._ready()
+        if inner is None:
+            raise AttributeError(name)
+        return getattr(inner, name)
+
+    def latest_frame(self):
+        inner = self._ready()
+        return inner.latest_frame() if inner is not None else None
+
+    def hands(self, frame):
+        inner = self._ready()
+        return inner.hands(frame) if inner is not None else (None, None)
+
+    def close(self, timeout: float = CLOSE_TIMEOUT):
+        self.loader.wait(timeout)                # never hang on quit (e.g. a camera that won't open)
+        if self._ready() is not None:
+            self.inner.close()
+        else:
+            self.loader.release()
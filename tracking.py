@@ -1,63 +1,146 @@
 """
 MediaPipe hand-tracking utilities.
 Grabbing, detection and small helper functions live here so sprites stay clean.
+MediaPipe itself is only imported by load_model() (or the first
+detect_hands() call), so importing this module is cheap.
 """
 
 from __future__ import annotations
-import cv2, mediapipe as mp, pygame
+import threading, time
+import cv2, numpy as np, pygame
 from pygame import Vector2
 
-mp_hands = mp.solutions.hands
-hands = mp_hands.Hands(
-    static_image_mode=False, max_num_hands=2, model_complexity=0,
-    min_detection_confidence=0.8, min_tracking_confidence=0.5,
-)
+from hand_state import HandState
+
+_hands = None                     # mediapipe Hands model, built by load_model()
+_model_lock = threading.Lock()
+
+
+def load_model():
+    """Import MediaPipe and build the hand model (slow – call it early, off the render thread)."""
+    global _hands
+    with _model_lock:
+        if _hands is None:
+            import mediapipe as mp
+            _hands = mp.solutions.hands.Hands(
+                static_image_mode=False, max_num_hands=2, model_complexity=0,
+                min_detection_confidence=0.8, min_tracking_confidence=0.5,
+            )
+    return _hands
 
 # ────────────────────────────────
 # Frame capture
 # ────────────────────────────────
-def grab_frame(cam, w: int, h: int):
+BLUR_MODES = ("gaussian", "pyramid", "box", "off")
+
+def blur_frame(frame, mode: str = "pyramid", ksize: int = 41):
+    """
+    Cosmetic background blur.
+      gaussian – full-resolution ksize×ksize Gaussian (the original look, slowest)
+      pyramid  – pyrDown ×2, small Gaussian, upscale: about the same look for a fraction of the cost
+      box      – stack blur (box blur on older OpenCV)
+      off      – no blur
+    """
+    if mode == "off":
+        return frame
+    if mode == "gaussian":
+        return cv2.GaussianBlur(frame, (ksize, ksize), sigmaX=0)
+    if mode == "pyramid":
+        levels = 2
+        small = frame
+        for _ in range(levels):
+            small = cv2.pyrDown(small)
+        k = max(3, (ksize >> levels) | 1)           # same blur radius at ¼ resolution
+        small = cv2.GaussianBlur(small, (k, k), sigmaX=0)
+        return cv2.resize(small, (frame.shape[1], frame.shape[0]), interpolation=cv2.INTER_LINEAR)
+    if mode == "box":
+        if hasattr(cv2, "stackBlur"):
+            return cv2.stackBlur(frame, (ksize, ksize))
+        return cv2.blur(cv2.blur(frame, (ksize // 2 | 1,) * 2), (ksize // 2 | 1,) * 2)
+    raise ValueError(f"Unknown blur mode {mode!r} (expected one of {BLUR_MODES})")
+
+FULL_VIEW = (0.0, 0.0, 1.0, 1.0)     # (x0, y0, w, h) – normalised camera crop shown on screen
+
+def screen_view(cam_w: int, cam_h: int, w: int, h: int) -> tuple[float, float, float, float]:
+    """Centred crop of a cam_w×cam_h image that has the screen's w:h aspect."""
+    cam_aspect, screen_aspect = cam_w / cam_h, w / h
+    if cam_aspect > screen_aspect:                 # camera wider → trim the sides
+        sw = screen_aspect / cam_aspect
+        return (1 - sw) / 2, 0.0, sw, 1.0
+    sh = cam_aspect / screen_aspect                # camera taller → trim top/bottom
+    return 0.0, (1 - sh) / 2, 1.0, sh
+
+def grab_frame(cam, w: int, h: int, blur: str = "pyramid", blur_detect: bool = False,
+               detect_size: int = 256, stats: dict | None = None):
+    """
+    Return (display_bgr, detect_rgb, view).
+      display_bgr – w×h, cropped (not stretched) to the screen aspect, blurred
+      detect_rgb  – whole camera image, aspect kept, longest side = detect_size,
+                    sharp unless *blur_detect* is set
+      view        – where display_bgr sits inside detect_rgb (see to_screen)
+    With *stats*, stats["read_ts"] is set to the time.perf_counter() at which
+    cam.read() returned, stats["blur"] to the display blur time in ms and
+    stats["blur_detect"] to the detection-frame blur time (0 when off).
+    """
     ok, frame = cam.read()
+    if stats is not None:
+        stats["read_ts"] = time.perf_counter()
     if not ok:
-        return None, None
+        return None, None, FULL_VIEW
     frame = cv2.flip(frame, 1)            # mirror left/right
-    frame = cv2.resize(frame, (w, h))
-    frame = cv2.GaussianBlur(frame, (41, 41), sigmaX=0)
-    return frame, cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+    cam_h, cam_w = frame.shape[:2]
+
+    view = screen_view(cam_w, cam_h, w, h)
+    x0, y0 = round(view[0] * cam_w), round(view[1] * cam_h)
+    crop = frame[y0:y0 + round(view[3] * cam_h), x0:x0 + round(view[2] * cam_w)]
+    display = cv2.resize(crop, (w, h))
+    t0 = time.perf_counter()
+    display = blur_frame(display, blur)
+    blur_ms = (time.perf_counter() - t0) * 1000
+
+    scale = detect_size / max(cam_w, cam_h)
+    detect = cv2.resize(frame, (round(cam_w * scale), round(cam_h * scale)), interpolation=cv2.INTER_AREA)
+    blur_detect_ms = 0.0
+    if blur_detect:
+        k = round(41 * scale * view[2] * cam_w / w) | 1      # same blur radius relative to the image
+        t0 = time.perf_counter()
+        detect = blur_frame(detect, blur, ksize=max(3, k))
+        blur_detect_ms = (time.perf_counter() - t0) * 1000
+    if stats is not None:
+        stats["blur"], stats["blur_detect"] = blur_ms, blur_detect_ms
+    return display, cv2.cvtColor(detect, cv2.COLOR_BGR2RGB), view
 
 # ────────────────────────────────
 # Landmark helpers
 # ────────────────────────────────
-def hand_is_open(hand_lms) -> bool:
+def hand_is_open(hand: HandState) -> bool:
     """True if index--pinkie fingertips are above their PIP joints (thumb ignored)."""
-    tips = [mp_hands.HandLandmark.INDEX_FINGER_TIP,
-            mp_hands.HandLandmark.MIDDLE_FINGER_TIP,
-            mp_hands.HandLandmark.RING_FINGER_TIP,
-            mp_hands.HandLandmark.PINKY_TIP]
-    pips = [mp_hands.HandLandmark.INDEX_FINGER_PIP,
-            mp_hands.HandLandmark.MIDDLE_FINGER_PIP,
-            mp_hands.HandLandmark.RING_FINGER_PIP,
-            mp_hands.HandLandmark.PINKY_PIP]
-    return all(hand_lms.landmark[t].y < hand_lms.landmark[p].y for t, p in zip(tips, pips))
-
-def center_px(hand_lms, w: int, h: int) -> Vector2:
-    """Return the pixel-coords centre of all 21 landmarks."""
-    cx = sum(lm.x for lm in hand_lms.landmark) / 21 * w
-    cy = sum(lm.y for lm in hand_lms.landmark) / 21 * h
-    return Vector2(cx, cy)
+    return hand.is_open
+
+def to_screen(x: float, y: float, w: int, h: int, view=FULL_VIEW) -> Vector2:
+    """Normalised detection-frame coords → screen pixels (through the display crop)."""
+    return Vector2((x - view[0]) / view[2] * w, (y - view[1]) / view[3] * h)
+
+def center_px(hand: HandState, w: int, h: int, view=FULL_VIEW) -> Vector2:
+    """Return the screen-pixel centre of all 21 landmarks."""
+    return to_screen(hand.centroid[0], hand.centroid[1], w, h, view)
+
+def landmarks_to_array(hand_lms) -> np.ndarray:
+    """MediaPipe landmark list → (21, 3) float32 array of normalised x, y, z."""
+    return np.array([(lm.x, lm.y, lm.z) for lm in hand_lms.landmark], dtype=np.float32)
 
 # ────────────────────────────────
 # Convenience wrapper
 # ────────────────────────────────
 def detect_hands(frame_rgb):
-    """Return (left_hand_lms, right_hand_lms) or (None, None)."""
+    """Return (left, right) HandStates; either may be None."""
     left = right = None
-    results = hands.process(frame_rgb)
+    results = (_hands or load_model()).process(frame_rgb)
     if results.multi_hand_landmarks and results.multi_handedness:
         for lms, handedness in zip(results.multi_hand_landmarks,
                                    results.multi_handedness):
             if handedness.classification[0].label == "Left":
-                left = lms
+                left = HandState(landmarks_to_array(lms))
             else:
-                right = lms
+                right = HandState(landmarks_to_array(lms))
     return left, right
@@ -10,36 +10,60 @@ Handles 4 simple game-states:
 • Asteroids this wave      = ⌊(wave⋅1.5) × wave_duration / 5⌋
   (they’re spawned evenly across the wave)
 
-Call `.handle_event()` from your event-loop, `.update()` once per frame,
-and `.hud_text()` to draw status text.
+Asteroids are spawned into an asteroid_field.AsteroidField. All timers run
+on the injected clock (sim_clock by default), so waves last the same whatever
+the frame rate, and a headless run can advance the clock as fast as it likes.
+Call `.update()` once per simulation tick and `.hud_text()` to draw status text.
+
+Each wave's spawns are decided up front as a SpawnTimeline (spawn times,
+edge positions, velocities toward the centre, spins, sizes, sprite index),
+drawn from a generator seeded by (seed, wave): the same seed replays the
+same waves, and `timeline(wave)` can be inspected without running them.
 """
 
 from __future__ import annotations
-import pygame, random, math
+import math
 from pathlib import Path
+import numpy as np
 
-from helpers import load_images_from_folder, scale_random
-from sprites  import Asteroid
+from asset_registry import registry
+from asteroid_field import AsteroidField
+from sim_clock import sim_clock, SimClock
 
+MIN_SIZE, MAX_SIZE = 40, 100      # px – asteroid side, snapped to asset_registry.SIZE_BUCKET
+
+
+class SpawnTimeline:
+    """One wave's asteroids: row k spawns `t_ms[k]` ms after the wave starts."""
+    __slots__ = ("t_ms", "pos", "vel", "spin", "size", "sprite")
+
+    def __init__(self, t_ms, pos, vel, spin, size, sprite):
+        self.t_ms, self.pos, self.vel, self.spin, self.size, self.sprite = t_ms, pos, vel, spin, size, sprite
+
+    def __len__(self):
+        return len(self.t_ms)
 
-class WaveManager:
-    SPAWN_EVT = pygame.USEREVENT + 99          # private event id
 
+class WaveManager:
     def __init__(self,
-        asteroid_group: pygame.sprite.Group,
-        all_sprites: pygame.sprite.Group,
+        field: AsteroidField,
         screen_w: int, screen_h: int,
-        asteroid_folder: Path):
-        self.asteroid_group = asteroid_group
-        self.all_sprites = all_sprites
+        asteroid_folder: Path,
+        clock: SimClock = sim_clock,
+        seed: int | None = None):
+        self.field = field
+        self.clock = clock
+        self.seed = int(np.random.SeedSequence().entropy % 2**32) if seed is None else seed
         self.W, self.H = screen_w, screen_h
         self.asteroid_folder = asteroid_folder
 
         # ─ Runtime state ─
         self.wave = 0
         self.state = "MENU"               # MENU | WAVE | COOLDOWN | GAME_OVER
-        self.ends_at_ms = 0               # pygame.time.get_ticks timestamp
+        self.ends_at_ms = 0               # clock.ms timestamp
         self.to_spawn = self.spawned = 0  # per-wave counters
+        self.started_ms = 0               # clock.ms when the current wave began
+        self.spawns: SpawnTimeline | None = None
         self.cooldown_ms = 8000
 
     # ──────────────────────────────────────────────────────────────
@@ -49,36 +73,24 @@ class WaveManager:
         self.wave = 0
         self.state = "MENU"
 
-    def handle_event(self, ev):
-        """
-        • From main event-loop.
-        • Returns True if *ev* was consumed (asteroid spawn), so main-loop
-          can just continue.
-        """
-        if ev.type == self.SPAWN_EVT and self.state == "WAVE":
-            if self.spawned < self.to_spawn:
-                self._spawn_asteroid()
-            if self.spawned >= self.to_spawn:        # finished quota
-                pygame.time.set_timer(self.SPAWN_EVT, 0)
-            return True
-        return False
-
     def update(self, player_alive: bool):
         """
-        Call every frame. Handles state transitions.
+        Call every simulation tick. Spawns due asteroids, handles state transitions.
         """
-        now = pygame.time.get_ticks()
+        now = self.clock.ms
 
         if self.state == "MENU":
             return
 
         if not player_alive and self.state != "GAME_OVER":
             self.state = "GAME_OVER"
-            pygame.time.set_timer(self.SPAWN_EVT, 0)
             return
 
         if self.state == "WAVE":
-            if now >= self.ends_at_ms and not self.asteroid_group:
+            t = now - self.started_ms
+            while self.spawned < self.to_spawn and t >= self.spawns.t_ms[self.spawned]:
+                self._spawn_asteroid(self.spawned)
+            if now >= self.ends_at_ms and not len(self.field):
                 self._start_cooldown()
 
         elif self.state == "COOLDOWN":
@@ -90,7 +102,7 @@ class WaveManager:
     # ──────────────────────────────────────────────────────────────
     def hud_text(self) -> str:
         """Short string to overlay on screen."""
-        now = pygame.time.get_ticks()
+        now = self.clock.ms
         if self.state == "MENU":
             return ""
         if self.state == "WAVE":
@@ -106,39 +118,53 @@ class WaveManager:
     # ──────────────────────────────────────────────────────────────
     # Internal helpers
     # ──────────────────────────────────────────────────────────────
-    def _spawn_asteroid(self):
-        img = scale_random(random.choice(load_images_from_folder(self.asteroid_folder)))
-        a   = Asteroid(img, self.W, self.H)
-        self.asteroid_group.add(a); self.all_sprites.add(a)
+    @staticmethod
+    def wave_params(wave: int) -> tuple[int, int, int]:
+        """(duration ms, asteroid quota, spawn interval ms) of *wave*."""
+        wave_dur_ms = (10 + wave * 10) * 1000           # 10s + n*10s
+        to_spawn = int((wave * 1.5) * (wave_dur_ms / 1000) / 5)
+        return wave_dur_ms, to_spawn, max(200, wave_dur_ms // max(1, to_spawn))
+
+    def timeline(self, wave: int) -> SpawnTimeline:
+        """Every spawn of *wave*, decided by (seed, wave) alone."""
+        _, n, interval_ms = self.wave_params(wave)
+        rng = np.random.default_rng([self.seed, wave])
+        pos, vel, spin = self.field.edge_spawns(n, rng)
+        size = [registry.snap_size(s, MIN_SIZE, MAX_SIZE) for s in rng.integers(MIN_SIZE, MAX_SIZE + 1, n).tolist()]
+        sprite = rng.integers(0, len(registry.folder(self.asteroid_folder)), n)
+        t_ms = interval_ms * np.arange(1, n + 1)            # spread evenly across the wave
+        return SpawnTimeline(t_ms, pos, vel, spin, size, sprite)
+
+    def _spawn_asteroid(self, k: int):
+        tl = self.spawns
+        img = registry.folder(self.asteroid_folder)[tl.sprite[k]]
+        self.field.spawn(registry.scaled(img, (tl.size[k], tl.size[k])), tl.pos[k], tl.vel[k], float(tl.spin[k]))
         self.spawned += 1
 
     # -------------------------------------------------------------
     def _start_wave(self):
         self.wave += 1
-        wave_dur_ms = (10 + self.wave * 10) * 1000      # 10s + n*10s
+        wave_dur_ms, self.to_spawn, spawn_interval_ms = self.wave_params(self.wave)
         self.cooldown_ms = max(2000, 8000 - (self.wave - 1) * 2000)
+        self.spawns = self.timeline(self.wave)
 
-        # asteroid quota
-        self.to_spawn = int((self.wave * 1.5) * (wave_dur_ms / 1000) / 5)
-        spawn_interval_ms = max(200, wave_dur_ms // max(1, self.to_spawn))
-
-        pygame.time.set_timer(self.SPAWN_EVT, spawn_interval_ms)
         self.spawned = 0
         self.state = "WAVE"
-        self.ends_at_ms = pygame.time.get_ticks() + wave_dur_ms
+        self.started_ms = self.clock.ms
+        self.ends_at_ms = self.clock.ms + wave_dur_ms
         print(f"Wave {self.wave}  —  {self.to_spawn} asteroids over {wave_dur_ms/1000:.0f}s "
-              f"(spawn every {spawn_interval_ms} ms)")
+              f"(spawn every {spawn_interval_ms} ms, seed {self.seed})")
 
     def _start_cooldown(self):
-        pygame.time.set_timer(self.SPAWN_EVT, 0)
         self.state = "COOLDOWN"
-        self.ends_at_ms = pygame.time.get_ticks() + self.cooldown_ms
+        self.ends_at_ms = self.clock.ms + self.cooldown_ms
         print(f"Cooldown {self.cooldown_ms/1000:.0f}s")
 
     # -------------------------------------------------------------
     # External triggers (menu keys)
-    def launch_if_menu(self):
+    def launch_if_menu(self, first_wave: int = 1):
         if self.state == "MENU":
+            self.wave = first_wave - 1
             self._start_wave()
 
     def restart_if_gameover(self):